@@ -7,23 +7,52 @@ import asyncio
 import time
 import random
 
-from typing import Any, Dict, NoReturn
+from typing import Any, Callable, Dict, NoReturn
 
 from .enet_data.enums import ChannelTypeFunctionName
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .aioenet import EnetClient, ActuatorChannel, SensorChannel
+from .aioenet import (
+    EnetClient,
+    ActuatorChannel,
+    SensorChannel,
+    COMMAND_WINDOW,
+    REQUEST_RATE,
+    CONFIRM_TIMEOUT,
+)
 from .const import (
     DOMAIN,
+    CONF_PARAMETER_FILTER,
+    CONF_COMMAND_WINDOW,
+    CONF_CONFIRM_TIMEOUT,
+    CONF_REQUEST_RATE,
     ATTR_ENET_EVENT,
     EVENT_TYPE_INITIAL_PRESS,
     EVENT_TYPE_SHORT_RELEASE,
     EVENT_TYPE_LONG_RELEASE,
+    SIGNAL_DEVICES_ADDED,
+    SIGNAL_DEVICE_TRIGGER,
+    TOPOLOGY_REFRESH_INTERVAL,
+)
+from .device import async_setup_devices, async_remove_devices
+from .services import async_setup_services
+from .snapshot import (
+    get_values_store,
+    async_restore_values,
+    async_schedule_save_values,
+)
+from .timers import TimerWheel
+from .topology import (
+    get_topology_store,
+    async_load_cached_topology,
+    async_download_topology,
+    async_refresh_topology,
 )
-from .device import async_setup_devices
 
 _LOGGER = logging.getLogger(__name__)
 PLATFORMS: list[Platform] = [
@@ -57,31 +86,76 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.data["url"],
         entry.data["username"],
         entry.data["password"],
+        parameter_filter=entry.options.get(CONF_PARAMETER_FILTER),
+        command_window=entry.options.get(CONF_COMMAND_WINDOW, COMMAND_WINDOW),
+        request_rate=entry.options.get(CONF_REQUEST_RATE, REQUEST_RATE),
+        confirm_timeout=entry.options.get(CONF_CONFIRM_TIMEOUT, CONFIRM_TIMEOUT),
         # noconnect=True,
         # load_file="/workspaces/enet-homeassistant/examples/config_entry-enet-oliver.json",
         # ,noconnect=True, load_file="/workspaces/enet-homeassistant/examples/config_entry-enet-01JRNS5MR3V9DX73M7BQ79KC40.json"
     )
     hub.coordinator = EnetCoordinator(hass, hub, entry)
+    topology_store = hub.coordinator.topology_store
+    from_cache = await async_load_cached_topology(topology_store, hub)
 
+    online = True
     try:
         await hub.simple_login()
     except Exception as e:
-        _LOGGER.error("Failed to login to Enet Smart Home: %s", e)
-        return False
+        if not from_cache:
+            _LOGGER.error("Failed to login to Enet Smart Home: %s", e)
+            return False
+        _LOGGER.warning(
+            "Failed to login to Enet Smart Home, starting from cached devices: %s", e
+        )
+        online = False
 
     hass.data[DOMAIN][entry.entry_id] = hub
 
     try:
-        hub.devices = await hub.get_devices()
+        if from_cache:
+            hub.devices = await hub.coordinator.async_timed(
+                "topology", hub.get_devices()
+            )
+        else:
+            hub.devices = await hub.coordinator.async_timed(
+                "topology", async_download_topology(topology_store, hub)
+            )
     except Exception as e:
         _LOGGER.error("Failed to get devices from Enet Smart Home: %s", e)
         return False
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    await hub.coordinator.setup_event_listeners()
-    await async_setup_devices(hub.coordinator)
-
-    hass.loop.create_task(hub.coordinator.async_refresh())
+    if from_cache:
+        # The cached devices carry the values from when they were downloaded,
+        # the snapshot is newer. Events and refreshes overwrite both.
+        await async_restore_values(hub.coordinator.values_store, hub)
+
+    # Entities and registry devices do not depend on each other. Event
+    # subscriptions are only needed for updates, so the entry is loaded without
+    # waiting for them.
+    await asyncio.gather(
+        hub.coordinator.async_timed(
+            "platforms", hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        ),
+        hub.coordinator.async_timed("devices", async_setup_devices(hub.coordinator)),
+    )
+    if online or from_cache:
+        entry.async_create_background_task(
+            hass,
+            hub.coordinator.async_start_background(online, from_cache),
+            "enet_start",
+        )
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass, hub.coordinator.async_scheduled_topology_refresh, TOPOLOGY_REFRESH_INTERVAL
+        )
+    )
+    async_setup_services(hass)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    # The event poll never returns, it is cancelled when the entry is unloaded
+    entry.async_create_background_task(
+        hass, hub.coordinator.async_refresh(), "enet_events"
+    )
     return True
 
 
@@ -89,11 +163,30 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading Enet Smart Home entry")
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        hub = hass.data[DOMAIN].pop(entry.entry_id)
+        hub.tracker.clear()
+        # Pending motion clears and measurement flushes belong to removed entities
+        hub.coordinator.timers.cancel_all()
+        # A reload logs in with a new client, end the session of this one
+        try:
+            await asyncio.wait_for(hub.simple_logout(), 10)
+        except Exception as e:
+            _LOGGER.warning("Failed to logout from Enet Smart Home: %s", e)
 
     return unload_ok
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when the options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached topology when the config entry is removed."""
+    await get_topology_store(hass, entry).async_remove()
+    await get_values_store(hass, entry).async_remove()
+
+
 class EnetCoordinator(DataUpdateCoordinator):
     """Enet Smart Home coordinator responsible for subscribing to and handling events"""
 
@@ -113,18 +206,160 @@ class EnetCoordinator(DataUpdateCoordinator):
         self._last_event: Dict[str, Any] = {}
 
         self.function_uid_map: Dict[str, Any] = {}
+        self.topology_store = get_topology_store(hass, entry)
+        self.values_store = get_values_store(hass, entry)
+        self._topology_lock = asyncio.Lock()
+        self._entities_by_device: Dict[str, list] = {}
+        self.setup_timings: Dict[str, float] = {}
+        # Device triggers by device registry id, maintained by async_setup_devices
+        self.trigger_catalog: Dict[str, list] = {}
+        self.timers = TimerWheel(hass.loop)
+        # Rollbacks of unconfirmed commands run as tasks of the config entry
+        hub.tracker.create_task = lambda target: entry.async_create_background_task(
+            hass, target, "enet_command_rollback"
+        )
         if self.hub.baseurl.startswith("https://"):
-            asyncio.create_task(self.ping_forever())
+            entry.async_create_background_task(hass, self.ping_forever(), "enet_ping")
         _LOGGER.debug("EnetCoordinator initialized")
 
     async def setup_event_listeners(self) -> None:
         """Setup event listener for all output functions"""
         _LOGGER.debug("Setting up event listeners")
-        await self.hub.setup_event_subscription_battery_state()
-        for device in self.hub.devices:
-            func_uids = device.get_function_uids_for_event()
-            self.function_uid_map.update(func_uids)
-            await device.register_events()
+        # A topology refresh replaces devices, do not map events to old ones
+        async with self._topology_lock:
+            await self.hub.setup_event_subscription_battery_state()
+            for device in self.hub.devices:
+                func_uids = device.get_function_uids_for_event()
+                self.function_uid_map.update(func_uids)
+                await device.register_events()
+
+    async def async_subscribe_events(self) -> None:
+        """Subscribe to events in the background after setup"""
+        try:
+            await self.async_timed("subscriptions", self.setup_event_listeners())
+        except Exception as e:
+            _LOGGER.error("Failed to subscribe to Enet events: %s", e)
+
+    async def async_start_background(self, online: bool, from_cache: bool) -> None:
+        """Subscribe to events, then check the cached devices. Both change the
+        event mappings, so they run one after the other"""
+        if online:
+            await self.async_subscribe_events()
+        if from_cache:
+            await self.async_start_from_cache(online)
+
+    async def async_timed(self, phase: str, awaitable) -> Any:
+        """Await a setup phase and record how long it took"""
+        start = time.monotonic()
+        try:
+            return await awaitable
+        finally:
+            self.setup_timings[phase] = round(time.monotonic() - start, 3)
+            _LOGGER.debug(
+                "Setup phase %s took %.3fs", phase, self.setup_timings[phase]
+            )
+
+    async def async_start_from_cache(self, online: bool) -> None:
+        """Connect if setup started offline, then check if the cached devices
+        are still valid"""
+        if not online:
+            await self.async_connect()
+            await self.setup_event_listeners()
+        try:
+            await self.async_refresh_topology()
+        except Exception as e:
+            _LOGGER.warning("Failed to validate cached Enet devices: %s", e)
+        # Replace the restored values with the current ones
+        await self.async_resync_values()
+
+    async def async_resync_values(self) -> None:
+        """Fetch all current values from the server and update the entities
+        of the channels that changed"""
+        try:
+            channels = await self.hub.resync_values()
+        except Exception as e:
+            _LOGGER.warning("Failed to resync Enet values: %s", e)
+            return
+        for channel in channels:
+            for callback in channel.on_update_callbacks:
+                await callback()
+        if channels:
+            async_schedule_save_values(self.values_store, self.hub)
+
+    @callback
+    def async_register_entity(self, device_uid: str, entity) -> Callable[[], None]:
+        """Keep track of the entities of a device, return a callable that
+        unregisters the entity"""
+        entities = self._entities_by_device.setdefault(device_uid, [])
+        entities.append(entity)
+
+        @callback
+        def unregister() -> None:
+            entities.remove(entity)
+
+        return unregister
+
+    async def async_scheduled_topology_refresh(self, _now=None) -> None:
+        """Periodically pick up changes made to the project on the server"""
+        try:
+            await self.async_refresh_topology()
+        except Exception as e:
+            _LOGGER.warning("Failed to refresh Enet devices: %s", e)
+
+    async def async_refresh_topology(self, force: bool = False) -> None:
+        """Fetch changed devices from the server and add, remove or update
+        only the affected devices and entities"""
+        async with self._topology_lock:
+            current_devices = {device.uid: device for device in self.hub.devices}
+            changes = await async_refresh_topology(
+                self.topology_store, self.hub, force
+            )
+            if changes is None:
+                return
+            added, removed, updated = changes
+
+            # Drop the entities and event mappings of devices that were removed
+            # or will be recreated, the old Device objects are no longer used.
+            old_devices = removed + [
+                current_devices[device.uid]
+                for device in updated
+                if device.uid in current_devices
+            ]
+            for device in old_devices:
+                for function_uid in device.get_function_uids_for_event():
+                    self.function_uid_map.pop(function_uid, None)
+            await asyncio.gather(
+                *(
+                    entity.async_remove()
+                    for device in old_devices
+                    for entity in list(self._entities_by_device.get(device.uid, []))
+                )
+            )
+            async_remove_devices(self, removed)
+
+            changed = added + updated
+            await async_setup_devices(self, changed)
+            for device in changed:
+                self.function_uid_map.update(device.get_function_uids_for_event())
+                await device.register_events()
+            async_dispatcher_send(
+                self.hass, SIGNAL_DEVICES_ADDED.format(self.config_entry.entry_id), changed
+            )
+
+    async def async_connect(self) -> None:
+        """Login to the server, retrying until it is reachable"""
+        delay = 10
+        while True:
+            try:
+                await self.hub.simple_login()
+                _LOGGER.info("Connected to Enet Smart Home")
+                return
+            except Exception as e:
+                _LOGGER.warning(
+                    "Failed to login to Enet Smart Home, retrying in %ss: %s", delay, e
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 300)
 
     async def ping_forever(self):
         """Ping server to keep conncetion alive"""
@@ -146,13 +381,21 @@ class EnetCoordinator(DataUpdateCoordinator):
         # _LOGGER.debug("_async_update_data()")
         if self.hub._offline:
             return
+        failed = False
         while True:
             try:
                 event = await self.hub.get_events()
             except Exception as e:
                 _LOGGER.warning("Failed to fetch events, retrying: %s", e)
-                asyncio.sleep(10)
+                failed = True
+                await asyncio.sleep(10)
                 continue
+            if failed:
+                # Events may have been missed while the connection was down
+                failed = False
+                self.config_entry.async_create_background_task(
+                    self.hass, self.async_resync_values(), "enet_resync_values"
+                )
             if event:
                 try:
                     await self.handle_event(event)
@@ -224,9 +467,26 @@ class EnetCoordinator(DataUpdateCoordinator):
                         "type": event_type,
                         "subtype": str(subtype),
                     }
-                    self.hass.bus.async_fire(ATTR_ENET_EVENT, bus_data)
+                    # Triggered automations share the context of the bus event,
+                    # so traces and the logbook link them to the button press
+                    context = Context()
+                    self.hass.bus.async_fire(ATTR_ENET_EVENT, bus_data, context=context)
+                    # Device triggers listen on their own signal, so a button
+                    # press is only matched against its own triggers
+                    async_dispatcher_send(
+                        self.hass,
+                        SIGNAL_DEVICE_TRIGGER.format(
+                            bus_data["device_id"], bus_data["subtype"], event_type
+                        ),
+                        bus_data,
+                        context,
+                    )
                 else:
-                    await device.update_values(function_uid, values)
+                    # Events confirming a command show a value that is
+                    # already written
+                    if not self.hub.tracker.confirm(function_uid, values):
+                        await device.update_values(function_uid, values)
+                    async_schedule_save_values(self.values_store, self.hub)
 
             elif event["event"] == EVENT_DEVICE_BATTERY_STATE_CHANGED:
                 # _LOGGER.debug("Battery state changed: %s", event["eventData"])
@@ -238,4 +498,5 @@ class EnetCoordinator(DataUpdateCoordinator):
                 )
                 if device:
                     device.update_battery_state(battery_state)
+                    async_schedule_save_values(self.values_store, self.hub)
                     self.async_update_listeners()
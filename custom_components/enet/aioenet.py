@@ -2,15 +2,17 @@
 
 import logging
 import functools
+import heapq
 import time
 import json
+import re
 
 from typing import Any, Dict, Union
 
 import asyncio
 import aiohttp
 
-from .enums import ChannelUseType
+from .enums import ChannelUseType, ChannelPlatform
 from .enet_data.data import enet_data
 from .enet_data.constants import CHANNEL_TYPES_IGNORED
 from .enet_data.enums import (
@@ -21,12 +23,20 @@ from .enet_data.enums import (
     DeviceBatteryState,
 )
 from .enet_data.channel_mapping import CHANNEL_TYPE_CONFIGURATION
-from .enet_data.utils import getitem_from_dict
-from enum import StrEnum
+from .enet_data.utils import getitem_from_dict, intern_strings
+from enum import IntEnum, StrEnum
 
 log = logging.getLogger(__name__)
 
 
+class CommandPriority(IntEnum):
+    """Priority classes of the request scheduler, lower is served first"""
+
+    INTERACTIVE = 0
+    AUTOMATION = 1
+    BACKGROUND = 2
+
+
 class URL(StrEnum):
     """URLs for communicating with Enet server"""
 
@@ -39,6 +49,112 @@ class URL(StrEnum):
 
 ID_FILTER_ALL = "*"
 
+# Max number of concurrent requests when fetching all current values
+RESYNC_CONCURRENCY = 8
+
+# Max number of set_many commands in flight
+SET_MANY_CONCURRENCY = 8
+
+# Number of devices per getDevicesWithParameterFilter request and max number of
+# these requests in flight
+DEVICE_CHUNK_SIZE = 25
+DEVICE_FETCH_CONCURRENCY = 4
+
+# Field of getProjectInformation that changes when the project is edited
+PROJECT_MODIFICATION_FIELD = "modificationDate"
+
+# Filter used by earlier versions, excludes the scene values and names
+LEGACY_PARAMETER_FILTER = ".+\\.(SCV1|SCV2|SNA|PSN)\\[(.|1.|2.|3.|4.|5.)\\]+"
+
+# Output functions that report events (button presses, motion) rather than a state
+EVENT_FUNCTION_NAMES = {
+    ChannelTypeFunctionName.BUTTON_ROCKER,
+    ChannelTypeFunctionName.SCENE_CONTROL,
+    ChannelTypeFunctionName.TRIGGER_START,
+}
+
+# Application modes of the channels set up on each platform
+PLATFORM_APPLICATION_MODES = {
+    ChannelPlatform.LIGHT: {
+        ChannelApplicationMode.LIGHT_SWITCHING,
+        ChannelApplicationMode.LIGHT_DIMMING,
+    },
+    ChannelPlatform.COVER: {ChannelApplicationMode.BLINDS},
+    ChannelPlatform.SWITCH: {ChannelApplicationMode.SWITCHING},
+    ChannelPlatform.SENSOR: {
+        ChannelApplicationMode.SCENE,
+        ChannelApplicationMode.ENERGY,
+        ChannelApplicationMode.MOVEMENT,
+    },
+    ChannelPlatform.BINARY_SENSOR: {ChannelApplicationMode.MOVEMENT},
+}
+
+# Platforms creating an entity per output function instead of one per channel
+PLATFORM_OUTPUT_FUNCTIONS = {
+    ChannelPlatform.SENSOR: {
+        ChannelTypeFunctionName.BRIGHTNESS,
+        ChannelTypeFunctionName.ENERGY_ACTIVE,
+        ChannelTypeFunctionName.VOLTAGE,
+        ChannelTypeFunctionName.CURRENT,
+        ChannelTypeFunctionName.POWER_ACTIVE,
+    },
+    ChannelPlatform.BINARY_SENSOR: {ChannelTypeFunctionName.TRIGGER_START},
+}
+
+# Route kind of the battery sensor of a device
+BATTERY_ROUTE = "battery"
+
+# Input functions set from sliders. Only the newest value per channel and
+# function is sent, at most once per COMMAND_WINDOW seconds.
+COALESCED_FUNCTION_NAMES = {
+    ChannelTypeFunctionName.BRIGHTNESS,
+    ChannelTypeFunctionName.COVER_POSITION,
+    ChannelTypeFunctionName.TILT_POSITION,
+}
+COMMAND_WINDOW = 0.25
+
+# Token bucket of the request scheduler: requests per second and burst size.
+# A rate of 0 disables the limit.
+REQUEST_RATE = 20.0
+REQUEST_BURST = 20
+
+# Seconds to wait for the event confirming a command before its optimistic
+# value is rolled back. Covers confirm their position once they stopped.
+CONFIRM_TIMEOUT = 10.0
+COVER_CONFIRM_TIMEOUT = 120.0
+SLOW_CONFIRM_FUNCTION_NAMES = {
+    ChannelTypeFunctionName.COVER_POSITION,
+    ChannelTypeFunctionName.TILT_POSITION,
+}
+
+
+def minimal_parameter_filter():
+    """Return a getDevicesWithParameterFilter filter that excludes every
+    device parameter except those referenced in CHANNEL_TYPE_CONFIGURATION"""
+    used = sorted(
+        {
+            parameter
+            for config in CHANNEL_TYPE_CONFIGURATION.values()
+            for parameter in config.get("deviceParameters", {}).values()
+        }
+    )
+    return "^(?!(?:" + "|".join(re.escape(p) for p in used) + ")$).+$"
+
+
+def has_channel_parameters(raw_devices):
+    """Return False if no configured channel in raw_devices has any device
+    parameters, which means the parameter filter removed too much"""
+    channels = [
+        channel
+        for raw in raw_devices
+        for group in raw["deviceChannelConfigurationGroups"]
+        for channel in group["deviceChannels"]
+        if getitem_from_dict(
+            CHANNEL_TYPE_CONFIGURATION, [channel["channelTypeID"], "deviceParameters"]
+        )
+    ]
+    return not channels or any(channel["deviceParameters"] for channel in channels)
+
 
 class AuthError(Exception):
     "Authentication error"
@@ -64,7 +180,21 @@ def auth_if_needed(func):
 class EnetClient:
     """Client for communicating with a Enet Smart Home Server from Jung / Gira"""
 
-    def __init__(self, url, user, passwd, noconnect=False, load_file=""):
+    def __init__(
+        self,
+        url,
+        user,
+        passwd,
+        noconnect=False,
+        load_file="",
+        device_chunk_size=DEVICE_CHUNK_SIZE,
+        device_fetch_concurrency=DEVICE_FETCH_CONCURRENCY,
+        parameter_filter=None,
+        command_window=COMMAND_WINDOW,
+        request_rate=REQUEST_RATE,
+        request_burst=REQUEST_BURST,
+        confirm_timeout=CONFIRM_TIMEOUT,
+    ):
         self.user = user
         self.passwd = passwd
         if url.endswith("/"):
@@ -78,11 +208,21 @@ class EnetClient:
             connector = aiohttp.TCPConnector(keepalive_timeout=30)
             self._session = aiohttp.ClientSession(cookie_jar=jar, connector=connector)
         self._debug_requests = False
+        self.device_chunk_size = device_chunk_size
+        self.device_fetch_concurrency = device_fetch_concurrency
+        # Only fetch the device parameters that are used, unless overridden
+        self.parameter_filter = parameter_filter or minimal_parameter_filter()
+        self._custom_parameter_filter = bool(parameter_filter)
+        self.commands = CommandCoalescer(command_window)
+        self.scheduler = RequestScheduler(request_rate, request_burst)
+        self.tracker = CommandTracker(confirm_timeout)
         self._api_counter = 1
         self._cookie = ""
         self._last_event = {}
         self._raw_json = {}
+        self._device_locations = {}
         self._projectuid = None
+        self.project_version = None
         self._subscribers = []
         self.function_uid_map = {}
         self.devices = []
@@ -90,7 +230,7 @@ class EnetClient:
         if load_file:
             with open(load_file) as fp:
                 config = json.load(fp)
-                self._raw_json = config["data"]["enet_data"]
+                self._raw_json = intern_strings(config["data"]["enet_data"])
 
     async def initialize(self):
         """Initialize the client"""
@@ -197,18 +337,46 @@ class EnetClient:
                     callback(data, device)
 
     @auth_if_needed
-    async def request(self, url, method, params, raise_on_error=False, get_raw=False):
-        "Request data from the Enet Server"
+    async def request(
+        self,
+        url,
+        method,
+        params,
+        raise_on_error=False,
+        get_raw=False,
+        parse_in_executor=False,
+        priority=CommandPriority.AUTOMATION,
+        on_admitted=None,
+    ):
+        """Request data from the Enet Server. Use parse_in_executor for large
+        responses so decoding the JSON does not block the event loop.
+
+        Requests wait for the scheduler in order of priority, a priority of
+        None bypasses it, e.g. for the session and the event long poll.
+        on_admitted is called once the request is about to be sent."""
         if self._offline:
             log.debug(
                 "Offline mod, skipping request to %s%s %s", self.baseurl, url, method
             )
             return None
 
-        return await self._do_request(url, method, params, raise_on_error, get_raw)
+        if priority is not None:
+            await self.scheduler.acquire(priority)
+        if on_admitted is not None:
+            on_admitted()
+
+        return await self._do_request(
+            url, method, params, raise_on_error, get_raw, parse_in_executor
+        )
 
     async def _do_request(
-        self, url, method, params, raise_on_error=False, get_raw=False
+        self,
+        url,
+        method,
+        params,
+        raise_on_error=False,
+        get_raw=False,
+        parse_in_executor=False,
     ):
         req = {
             "jsonrpc": "2.0",
@@ -235,12 +403,16 @@ class EnetClient:
             else:
                 return response
 
-        json = await response.json()
-        if "error" in json:
-            returned_error = json["error"]
+        if parse_in_executor:
+            body = await response.read()
+            response_json = await asyncio.to_thread(json.loads, body)
+        else:
+            response_json = await response.json()
+        if "error" in response_json:
+            returned_error = response_json["error"]
             error_msg = f"-> {url} {method} returned error: {returned_error}"
             if returned_error["code"] in (-29998, -29997):
-                log.warning("Got auth error: %s", json["error"])
+                log.warning("Got auth error: %s", response_json["error"])
                 raise AuthError
             elif returned_error["code"] == -29999:
                 raise aiohttp.ServerTimeoutError
@@ -249,34 +421,43 @@ class EnetClient:
                 raise Exception(error_msg)
         else:
             if self._debug_requests:
-                log.debug("-> %s %s returned: %s", url, method, json["result"])
-        return json["result"]
+                log.debug("-> %s %s returned: %s", url, method, response_json["result"])
+        return response_json["result"]
 
     async def simple_login(self):
         """Login to the Enet Server"""
         params = dict(userName=self.user, userPassword=self.passwd)
         response = await self.request(
-            URL.MANAGEMENT, "userLogin", params, raise_on_error=True
+            URL.MANAGEMENT, "userLogin", params, raise_on_error=True, priority=None
         )
         response = await self.request(
-            URL.MANAGEMENT, "setClientRole", dict(clientRole="CR_VISU")
+            URL.MANAGEMENT,
+            "setClientRole",
+            dict(clientRole="CR_VISU"),
+            priority=None,
         )
         return response
 
     async def simple_logout(self):
         """Logout of the Enet Server"""
         try:
-            await self.request(URL.MANAGEMENT, "userLogout", None)
+            await self.request(URL.MANAGEMENT, "userLogout", None, priority=None)
         finally:
-            await self._session.close()
+            if self._session is not None:
+                await self._session.close()
 
     async def ping(self):
         """Ping server to keep connection alive"""
-        return await self.request(URL.MANAGEMENT, "ping", None)
+        return await self.request(URL.MANAGEMENT, "ping", None, priority=None)
 
     async def get_project(self):
         """Get the project which included the projectUID and the projectName"""
-        result = await self.request(URL.VISUALIZATION, "getCurrentProject", None)
+        result = await self.request(
+            URL.VISUALIZATION,
+            "getCurrentProject",
+            None,
+            priority=CommandPriority.BACKGROUND,
+        )
         self._projectuid = result["projectUID"]
         return result
 
@@ -288,30 +469,181 @@ class EnetClient:
             await self.get_project()
 
         params = {"projectUID": self._projectuid}
-        return await self.request(URL.VISUALIZATION, "getProjectInformation", params)
+        return await self.request(
+            URL.VISUALIZATION,
+            "getProjectInformation",
+            params,
+            priority=CommandPriority.BACKGROUND,
+        )
+
+    async def get_project_version(self):
+        """Return the projectUID and the modification date of the project.
+        Used to find out if the devices on the server have changed.
+
+        Returns None if the server does not report a modification date, the
+        version is unknown then and the devices have to be checked."""
+        information = await self.get_project_information() or {}
+        modification = information.get(PROJECT_MODIFICATION_FIELD)
+        if modification is None:
+            log.debug("Project information has no %s", PROJECT_MODIFICATION_FIELD)
+            return None
+        return {
+            "projectUID": self._projectuid,
+            "modification": modification,
+            # The cached devices are only valid for the filter they were fetched with
+            "parameterFilter": self.parameter_filter,
+        }
+
+    def export_topology(self):
+        """Return the downloaded devices and locations so they can be persisted"""
+        return {
+            "project_version": self.project_version,
+            "locations": self._device_locations,
+            "devices": self._raw_json,
+        }
+
+    def import_topology(self, topology):
+        """Use previously exported devices and locations instead of downloading them"""
+        self.project_version = topology["project_version"]
+        self._device_locations = topology["locations"]
+        self._raw_json = topology["devices"]
+
+    def clear_topology(self):
+        """Forget downloaded devices so the next get_devices() fetches them again"""
+        self.project_version = None
+        self._device_locations = {}
+        self._raw_json = {}
+
+    def export_values(self):
+        """Return the last known channel values and battery states"""
+        return {
+            "channels": {
+                channel.uid: channel.current_values
+                for device in self.devices
+                for channel in device.channels
+            },
+            "battery_states": {
+                device.uid: device.battery_state for device in self.devices
+            },
+        }
+
+    def import_values(self, values):
+        """Restore channel values and battery states exported by export_values()"""
+        channels = values.get("channels", {})
+        battery_states = values.get("battery_states", {})
+        for device in self.devices:
+            if device.uid in battery_states:
+                device.battery_state = battery_states[device.uid]
+            for channel in device.channels:
+                for type_id, value in channels.get(channel.uid, {}).items():
+                    if type_id in channel.current_values:
+                        channel.current_values[type_id] = value
 
     async def get_account(self):
         """Return the current logged in user account"""
         return await self.request(URL.MANAGEMENT, "getAccount", {})
 
     async def get_devices(self, device_uids=None):
-        """Get all the devices registered on the server"""
-        device_locations = {}
-        if not self._raw_json:
-            device_locations = await self.get_device_locations()
-            if device_uids is None:
-                device_uids = list(device_locations.keys())
-            params = {
-                "deviceUIDs": device_uids,
-                "filter": ".+\\.(SCV1|SCV2|SNA|PSN)\\[(.|1.|2.|3.|4.|5.)\\]+",
-            }
+        """Get all the devices registered on the server. If device_uids is
+        given, only these devices are fetched from the server and updated"""
+        if device_uids is None and self._raw_json:
+            return await asyncio.to_thread(self._create_devices_interned, self._raw_json)
+
+        if not self._device_locations:
+            self._device_locations = await self.get_device_locations()
+        if device_uids is None:
+            device_uids = list(self._device_locations.keys())
+        devices = []
+        async for raw_devices in self.iter_raw_devices(device_uids):
+            self._update_raw_devices(raw_devices)
+            devices += await asyncio.to_thread(self.create_devices, raw_devices)
+        return devices
+
+    async def get_raw_devices(self, device_uids):
+        """Fetch the device description of device_uids from the server"""
+        raw_devices = []
+        async for chunk in self.iter_raw_devices(device_uids):
+            raw_devices += chunk
+        return raw_devices
+
+    async def iter_raw_devices(self, device_uids):
+        """Fetch the device descriptions of device_uids in chunks of
+        device_chunk_size devices, several chunks at a time. Each chunk is
+        parsed and yielded as soon as it arrives.
+
+        Unless a parameter filter was configured, the first chunk is fetched
+        alone to check that the server understands the minimal filter."""
+        size = max(1, self.device_chunk_size)
+        semaphore = asyncio.Semaphore(max(1, self.device_fetch_concurrency))
+        chunks = [device_uids[i : i + size] for i in range(0, len(device_uids), size)]
+
+        async def request_chunk(chunk, parameter_filter):
+            params = {"deviceUIDs": chunk, "filter": parameter_filter}
             result = await self.request(
-                URL.VISUALIZATION, "getDevicesWithParameterFilter", params
+                URL.VISUALIZATION,
+                "getDevicesWithParameterFilter",
+                params,
+                parse_in_executor=True,
+                priority=CommandPriority.BACKGROUND,
+            )
+            return result["devices"]
+
+        async def fetch(chunk):
+            async with semaphore:
+                start = time.time()
+                raw_devices = await request_chunk(chunk, self.parameter_filter)
+            log.debug(
+                "Fetched %d devices in %.2fs", len(chunk), time.time() - start
             )
-            self._raw_json = result["devices"]
+            return await asyncio.to_thread(intern_strings, raw_devices)
+
+        async def probe(chunk):
+            raw_devices = await request_chunk(chunk, self.parameter_filter)
+            if has_channel_parameters(raw_devices):
+                return await asyncio.to_thread(intern_strings, raw_devices)
+            legacy_devices = await request_chunk(chunk, LEGACY_PARAMETER_FILTER)
+            if has_channel_parameters(legacy_devices):
+                # Only switch if the legacy filter really returns parameters
+                log.warning(
+                    "Server returned no device parameters with the minimal "
+                    "parameter filter, falling back to the legacy filter"
+                )
+                self.parameter_filter = LEGACY_PARAMETER_FILTER
+                self._custom_parameter_filter = True
+            return await asyncio.to_thread(intern_strings, legacy_devices)
+
+        if chunks and not self._custom_parameter_filter:
+            yield await probe(chunks.pop(0))
+
+        tasks = [asyncio.ensure_future(fetch(chunk)) for chunk in chunks]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
 
+    def _update_raw_devices(self, raw_devices):
+        """Add or replace raw_devices in the downloaded device descriptions"""
+        if not self._raw_json:
+            self._raw_json = raw_devices
+            return
+        index = {raw["uid"]: i for i, raw in enumerate(self._raw_json)}
+        for raw in raw_devices:
+            if raw["uid"] in index:
+                self._raw_json[index[raw["uid"]]] = raw
+            else:
+                self._raw_json.append(raw)
+
+    def _create_devices_interned(self, raw_devices):
+        intern_strings(raw_devices)
+        return self.create_devices(raw_devices)
+
+    def create_devices(self, raw_devices):
+        """Create Device objects, skipping catalog devices and failed devices.
+        Does not touch the event loop, so it can run in an executor"""
         devices = []
-        for raw_device in self._raw_json:
+        for raw_device in raw_devices:
             device = create_device(self, raw_device)
             if not device:
                 continue
@@ -319,15 +651,189 @@ class EnetClient:
                 # Ignore catalog devices, since they are just placeholders until devices are installed (missing serial number)
                 log.info("Ignoring catalog device %s", device.name)
                 continue
-            device.location = device_locations.get(device.uid, "")
+            device.location = self._device_locations.get(device.uid, "")
             devices.append(device)
 
         return devices
 
+    def get_platform_routes(self, platform, devices=None) -> list:
+        """Return the (kind, target) routes of a platform, for all devices by default"""
+        if devices is None:
+            devices = self.devices
+        return [
+            route
+            for device in devices
+            for route in device.platform_routes.get(platform, ())
+        ]
+
+    async def refresh_devices(self, full=False):
+        """Fetch new and changed devices from the server and update self.devices.
+
+        Without full, only devices that are new or have moved to another
+        location are fetched. With full, all devices are fetched and compared
+        with the current ones. Returns (added, removed, updated) devices, where
+        removed are the old Device objects and updated the new ones.
+        """
+        old_locations = self._device_locations
+        new_locations = await self.get_device_locations()
+        old_raw = {raw["uid"]: raw for raw in self._raw_json or []}
+
+        removed_uids = set(old_raw) - set(new_locations)
+        fetch_uids = [
+            uid
+            for uid, location in new_locations.items()
+            if full or uid not in old_raw or old_locations.get(uid) != location
+        ]
+        fetched = await self.get_raw_devices(fetch_uids) if fetch_uids else []
+
+        def find_changed():
+            return [
+                raw
+                for raw in fetched
+                if raw["uid"] not in old_raw
+                or old_locations.get(raw["uid"]) != new_locations.get(raw["uid"])
+                or device_signature(raw) != device_signature(old_raw[raw["uid"]])
+            ]
+
+        changed_raw = await asyncio.to_thread(find_changed)
+
+        self._device_locations = new_locations
+        self._raw_json = [
+            raw for raw in self._raw_json or [] if raw["uid"] not in removed_uids
+        ]
+        self._update_raw_devices(changed_raw)
+
+        new_devices = {
+            device.uid: device
+            for device in await asyncio.to_thread(self.create_devices, changed_raw)
+        }
+        current = {device.uid: device for device in self.devices}
+        added = [d for uid, d in new_devices.items() if uid not in current]
+        updated = [d for uid, d in new_devices.items() if uid in current]
+        removed = [d for uid, d in current.items() if uid in removed_uids]
+        # Devices that could no longer be created or became catalog devices
+        changed_uids = {raw["uid"] for raw in changed_raw}
+        removed += [
+            d
+            for uid, d in current.items()
+            if uid not in new_devices and uid in changed_uids
+        ]
+
+        replaced = {d.uid for d in removed} | {d.uid for d in updated}
+        self.devices = [d for d in self.devices if d.uid not in replaced]
+        self.devices += added + updated
+        log.debug(
+            "Refreshed devices: %d added, %d removed, %d updated",
+            len(added),
+            len(removed),
+            len(updated),
+        )
+        return added, removed, updated
+
+    async def resync_values(self, max_concurrency=RESYNC_CONCURRENCY):
+        """Fetch the current values of all output functions of all devices,
+        with at most max_concurrency requests in flight. Returns the channels
+        where a value changed."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        changed = []
+
+        async def resync(channel, output_function):
+            params = {"deviceFunctionUID": output_function["uid"]}
+            async with semaphore:
+                try:
+                    result = await self.request(
+                        URL.VISUALIZATION,
+                        "getCurrentValuesFromOutputDeviceFunction",
+                        params,
+                        priority=CommandPriority.BACKGROUND,
+                    )
+                except Exception as e:
+                    log.warning("Failed to fetch value of %s: %s", channel.name, e)
+                    return
+            if result is not None and channel.set_current_values_from_dict(
+                output_function["typeID"], result
+            ):
+                changed.append(channel)
+
+        start = time.time()
+        await asyncio.gather(
+            *(
+                resync(channel, output_function)
+                for device in self.devices
+                for channel in device.channels
+                for output_function in channel.output_functions.values()
+                if output_function["function"] not in EVENT_FUNCTION_NAMES
+            )
+        )
+        changed = list(dict.fromkeys(changed))
+        log.debug(
+            "Resynced values in %.2fs, %d channels changed",
+            time.time() - start,
+            len(changed),
+        )
+        return changed
+
+    async def set_many(
+        self,
+        items,
+        max_concurrency=SET_MANY_CONCURRENCY,
+        priority=CommandPriority.AUTOMATION,
+    ):
+        """Send (channel uid, function name, value) items concurrently, with at
+        most max_concurrency commands in flight.
+
+        Returns a result dict per item, in the order of items. A failing item
+        does not stop the others."""
+        channels = {
+            channel.uid: channel for device in self.devices for channel in device.channels
+        }
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def send(channel_uid, function_name, value):
+            result = {
+                "channel": channel_uid,
+                "function": function_name,
+                "value": value,
+                "success": False,
+            }
+            channel = channels.get(channel_uid)
+            if not isinstance(channel, ActuatorChannel):
+                result["error"] = "Unknown actuator channel"
+                return result
+            if channel.get_channel_configuration_entry(
+                "inputDeviceFunctions", function_name
+            ) not in channel.input_functions:
+                result["error"] = f"Channel has no {function_name} function"
+                return result
+            async with semaphore:
+                try:
+                    await channel.set_value(function_name, value, priority)
+                except Exception as e:
+                    log.warning("Failed to set %s of %s: %s", function_name, channel.name, e)
+                    result["error"] = str(e)
+                    return result
+            result["success"] = True
+            return result
+
+        start = time.time()
+        results = await asyncio.gather(*(send(*item) for item in items))
+        log.debug(
+            "Sent %d commands in %.2fs, %d failed",
+            len(results),
+            time.time() - start,
+            sum(1 for result in results if not result["success"]),
+        )
+        return results
+
     async def get_locations(self):
         """Get all locations"""
         params = {"locationUIDs": []}
-        result = await self.request(URL.VISUALIZATION, "getLocations", params)
+        result = await self.request(
+            URL.VISUALIZATION,
+            "getLocations",
+            params,
+            priority=CommandPriority.BACKGROUND,
+        )
         return result["locations"]
 
     async def get_device_locations(self):
@@ -354,7 +860,12 @@ class EnetClient:
 
     async def get_scenes(self, only_libenet=True):
         """Get all scene names and corresponding uid from the server"""
-        result = await self.request(URL.SCENE, "getSceneActionUIDs", None)
+        result = await self.request(
+            URL.SCENE,
+            "getSceneActionUIDs",
+            None,
+            priority=CommandPriority.BACKGROUND,
+        )
         if not result:
             return {}
         scenes = {}
@@ -366,10 +877,12 @@ class EnetClient:
             scenes[scene_name] = scene_uid
         return scenes
 
-    async def activate_scene(self, scene_uid):
+    async def activate_scene(self, scene_uid, priority=CommandPriority.INTERACTIVE):
         """Activate the specified scene UID"""
         params = {"actionUID": scene_uid}
-        await self.request(URL.VISUALIZATION, "executeAction", params)
+        await self.request(
+            URL.VISUALIZATION, "executeAction", params, priority=priority
+        )
 
     async def setup_event_subscription(self, func_uid):
         """Subscribe for outputDeviceFunction events"""
@@ -377,6 +890,7 @@ class EnetClient:
             URL.VISUALIZATION,
             "registerEventOutputDeviceFunctionCalled",
             {"deviceFunctionUID": func_uid},
+            priority=CommandPriority.BACKGROUND,
         )
         return result
 
@@ -386,18 +900,340 @@ class EnetClient:
             URL.VISUALIZATION,
             "registerEventDeviceBatteryStateChanged",
             None,
+            priority=CommandPriority.BACKGROUND,
         )
         return result
 
     async def get_events(self):
         """Poll Enet server for events"""
         try:
-            result = await self.request(URL.VISUALIZATION, "requestEvents", None)
+            result = await self.request(
+                URL.VISUALIZATION, "requestEvents", None, priority=None
+            )
             return result
         except aiohttp.ServerTimeoutError:
             return None
 
 
+class CommandCoalescer:
+    """Send only the newest command per key, with at most one in flight.
+
+    While a command is in flight, or within window seconds after it was sent,
+    newer commands for the same key replace the pending one. Callers of
+    replaced commands return when the command replacing theirs is done."""
+
+    def __init__(self, window=COMMAND_WINDOW):
+        self.window = window
+        self._pending = {}
+        self._running = {}
+        self.sent = 0
+        self.replaced = 0
+
+    async def submit(self, key, send):
+        """Queue send, a coroutine function, for key and wait until it or a
+        newer command for key was sent"""
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.replaced += 1
+            self._pending[key] = (send, pending[1] + [future])
+        else:
+            self._pending[key] = (send, [future])
+        if key not in self._running:
+            self._running[key] = asyncio.ensure_future(self._run(key))
+        return await future
+
+    def discard(self, keys):
+        """Drop the pending commands of keys, their callers return None"""
+        for key in keys:
+            _send, futures = self._pending.pop(key, (None, []))
+            for future in futures:
+                if not future.done():
+                    future.set_result(None)
+
+    async def _run(self, key):
+        loop = asyncio.get_running_loop()
+        try:
+            while key in self._pending:
+                send, futures = self._pending.pop(key)
+                started = loop.time()
+                try:
+                    result = await send()
+                except Exception as e:
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for future in futures:
+                        if not future.done():
+                            future.set_result(result)
+                self.sent += 1
+                # Commands submitted within the window wait and are coalesced
+                await asyncio.sleep(max(0, started + self.window - loop.time()))
+        finally:
+            del self._running[key]
+            self.discard([key])
+
+
+class RequestScheduler:
+    """Admit requests in order of priority, limited by a token bucket.
+
+    Requests pass right away while tokens are left. Otherwise they queue and
+    are admitted by priority, then in arrival order, as tokens refill."""
+
+    def __init__(self, rate=REQUEST_RATE, burst=REQUEST_BURST):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = None
+        self._queue = []
+        self._counter = 0
+        self._wakeup = None
+        self.max_queue_depth = 0
+        self._stats = {
+            priority: {"requests": 0, "wait_total": 0.0, "wait_max": 0.0}
+            for priority in CommandPriority
+        }
+
+    async def acquire(self, priority):
+        """Wait until a request of priority may be sent"""
+        if not self.rate or self.rate <= 0:
+            self._record(priority, 0.0)
+            return
+        loop = asyncio.get_running_loop()
+        self._refill(loop.time())
+        if not self._queue and self._tokens >= 1:
+            self._tokens -= 1
+            self._record(priority, 0.0)
+            return
+
+        future = loop.create_future()
+        self._counter += 1
+        heapq.heappush(self._queue, (priority, self._counter, loop.time(), future))
+        self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+        self._schedule(loop)
+        await future
+
+    def _refill(self, now):
+        if self._updated is not None:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+        self._updated = now
+
+    def _schedule(self, loop):
+        if self._wakeup is None and self._queue:
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            self._wakeup = loop.call_later(delay, self._dispatch, loop)
+
+    def _dispatch(self, loop):
+        self._wakeup = None
+        now = loop.time()
+        self._refill(now)
+        while self._queue and self._tokens >= 1:
+            priority, _counter, enqueued, future = heapq.heappop(self._queue)
+            if future.done():  # The caller was cancelled
+                continue
+            self._tokens -= 1
+            self._record(priority, now - enqueued)
+            future.set_result(None)
+        self._schedule(loop)
+
+    def _record(self, priority, wait):
+        stats = self._stats[priority]
+        stats["requests"] += 1
+        stats["wait_total"] += wait
+        stats["wait_max"] = max(stats["wait_max"], wait)
+
+    @property
+    def queue_depth(self):
+        """Number of requests waiting to be sent"""
+        return sum(1 for entry in self._queue if not entry[3].done())
+
+    def metrics(self):
+        """Return queue depth and wait times per priority"""
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "priorities": {
+                priority.name.lower(): {
+                    "requests": stats["requests"],
+                    "wait_avg": stats["wait_total"] / stats["requests"]
+                    if stats["requests"]
+                    else 0.0,
+                    "wait_max": stats["wait_max"],
+                }
+                for priority, stats in self._stats.items()
+            },
+        }
+
+
+class CommandTracker:
+    """Match commands with the outputDeviceFunctionCalled events confirming them.
+
+    Channels show the value of a command right away. The confirming event
+    needs no second state update, values that are not confirmed within the
+    timeout are rolled back to the last confirmed value.
+
+    create_task runs the update callbacks of rolled back channels. Without it
+    the tracker keeps the tasks itself."""
+
+    def __init__(self, timeout=CONFIRM_TIMEOUT, create_task=None):
+        self.timeout = timeout
+        self.create_task = create_task
+        self._tasks = set()
+        # Output function uid -> command waiting for its confirmation
+        self._pending = {}
+        self.confirmed = 0
+        self.mismatched = 0
+        self.expired = 0
+        self.failed = 0
+        self._rtt_total = 0.0
+        self._rtt_max = 0.0
+
+    def expect(self, uid, channel, type_id, previous, expected, timeout=None):
+        """Wait for output function uid of channel to report expected. A newer
+        command replaces the expected value but keeps the confirmed one"""
+        entry = self._pending.get(uid)
+        if entry is None:
+            self._pending[uid] = {
+                "channel": channel,
+                "type_id": type_id,
+                "previous": previous,
+                "expected": expected,
+                "timeout": timeout or self.timeout,
+                "sent": None,
+                "outstanding": 0,
+                "handle": None,
+            }
+        else:
+            entry["expected"] = expected
+            entry["timeout"] = timeout or self.timeout
+
+    def start(self, uids):
+        """The commands for uids are being sent, start their timeouts"""
+        loop = asyncio.get_running_loop()
+        for uid in uids:
+            entry = self._pending.get(uid)
+            if entry is None:
+                continue
+            entry["sent"] = loop.time()
+            entry["outstanding"] += 1
+            if entry["handle"] is not None:
+                entry["handle"].cancel()
+            entry["handle"] = loop.call_later(entry["timeout"], self._expire, uid)
+
+    def fail(self, uids, started=True):
+        """The commands for uids could not be sent, roll them back unless other
+        commands for them are still waiting for confirmation. started is False
+        if the command failed before start() was called for it"""
+        for uid in uids:
+            entry = self._pending.get(uid)
+            if entry is None:
+                continue
+            if started:
+                entry["outstanding"] -= 1
+            if entry["outstanding"] <= 0:
+                self.failed += 1
+                self._rollback(uid)
+
+    def confirm(self, uid, values):
+        """Handle an event for output function uid. Returns True if it only
+        confirms the value already shown and needs no update"""
+        entry = self._pending.get(uid)
+        if entry is None:
+            return False
+        if not entry["outstanding"]:
+            # The command was never sent, the event is newer
+            self._pop(uid)
+            return False
+        entry["outstanding"] -= 1
+        value = values[0].get("value") if len(values) == 1 else None
+        if value == entry["expected"]:
+            rtt = asyncio.get_running_loop().time() - entry["sent"]
+            self._rtt_total += rtt
+            self._rtt_max = max(self._rtt_max, rtt)
+            self.confirmed += 1
+            self._pop(uid)
+            log.debug("%s confirmed after %.3fs", entry["channel"].name, rtt)
+            return True
+        if entry["outstanding"] > 0:
+            # Confirms an older command, the newest value is still on its way
+            return True
+        self.mismatched += 1
+        self._pop(uid)
+        return False
+
+    def _pop(self, uid):
+        entry = self._pending.pop(uid)
+        if entry["handle"] is not None:
+            entry["handle"].cancel()
+        return entry
+
+    def _expire(self, uid):
+        entry = self._pending.get(uid)
+        if entry is None:
+            return
+        entry["handle"] = None
+        self.expired += 1
+        log.warning(
+            "%s did not confirm %s within %ss",
+            entry["channel"].name,
+            entry["expected"],
+            entry["timeout"],
+        )
+        self._rollback(uid)
+
+    def _rollback(self, uid):
+        entry = self._pop(uid)
+        channel = entry["channel"]
+        current = channel.current_values.get(entry["type_id"])
+        if current is None or current.get("value") != entry["expected"]:
+            return
+        current["value"] = entry["previous"]
+        if self.create_task is not None:
+            self.create_task(channel.notify_update())
+            return
+        task = asyncio.get_running_loop().create_task(channel.notify_update())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def clear(self):
+        """Stop tracking all commands, e.g. when the client is shut down"""
+        for uid in list(self._pending):
+            self._pop(uid)
+        for task in self._tasks:
+            task.cancel()
+
+    def metrics(self):
+        """Return confirmation counts and round-trip times"""
+        return {
+            "timeout": self.timeout,
+            "pending": len(self._pending),
+            "confirmed": self.confirmed,
+            "mismatched": self.mismatched,
+            "expired": self.expired,
+            "failed": self.failed,
+            "rtt_avg": self._rtt_total / self.confirmed if self.confirmed else 0.0,
+            "rtt_max": self._rtt_max,
+        }
+
+
+def device_signature(raw):
+    """Return the device description without values that change at runtime"""
+    if isinstance(raw, dict):
+        return {
+            key: device_signature(value)
+            for key, value in raw.items()
+            if key not in ("currentValues", "batteryState")
+        }
+    if isinstance(raw, list):
+        return [device_signature(value) for value in raw]
+    return raw
+
+
 def create_device(client, raw):
     """Create an enet Actuator or Sensor depending on its type"""
     device_type = raw["typeID"]
@@ -431,6 +1267,8 @@ class Device:
         self.serial_number = self._raw["metaData"]["serialNumber"]
         self.software_update_available = self._raw["isSoftwareUpdateAvailable"]
         self.create_channels()
+        self.platform_routes = self.route_entities()
+        self.trigger_subtypes = self.find_trigger_subtypes()
 
     def __repr__(self):
         return f"{self.__class__.__name__} Name: {self.name} Type: {self.device_type}"
@@ -445,8 +1283,8 @@ class Device:
 
         for channel_config_group in self._raw["deviceChannelConfigurationGroups"]:
             for device_channel in channel_config_group["deviceChannels"]:
-                channel_use_type = self.get_channel_use_type(device_channel)
                 channel_type_id = device_channel["channelTypeID"]
+                channel_use_type = ChannelTypeInfo.get(channel_type_id).use_type
 
                 match channel_use_type:
                     case ChannelUseType.ACTUATOR:
@@ -474,33 +1312,49 @@ class Device:
                     channel.output_functions,
                 )
 
-    def get_channel_use_type(self, device_channel):
-        """Determine if the channel is an actuator or a sensor"""
-        channel_type_id = device_channel["channelTypeID"]
-        channel_type_config = CHANNEL_TYPE_CONFIGURATION.get(channel_type_id)
-
-        if channel_type_id in CHANNEL_TYPES_IGNORED:
-            return ChannelUseType.IGNORED
-
-        # CT_1F01_DUMMY has type None, but needs to be supported as well
-        channel_meta_data = enet_data.get_channel_meta_data_from_channel_type(
-            channel_type_id
-        )
-        if channel_meta_data.get("useTypeID", "") == ChannelTypeUseType.ACTUATOR:
-            if channel_meta_data.get("subSectionTypeID", "") in {
-                ChannelTypeSubSectionType.BLINDS,
-                ChannelTypeSubSectionType.LIGHT,
-            }:
-                return ChannelUseType.ACTUATOR
-            else:  # Special case for CT_1F19 energy sensor
-                return ChannelUseType.SENSOR
-        elif channel_meta_data.get("useTypeID", "") == ChannelTypeUseType.SENSOR:
-            return ChannelUseType.SENSOR
+    def route_entities(self):
+        """Sort the device and its channels into the platforms they are set up on.
 
-        if channel_type_config is None:
-            return ChannelUseType.UNSUPPORTED
+        Returns a dict of platform to a list of (kind, target) tuples. The kind is
+        the application mode, the output function name or BATTERY_ROUTE and lets
+        the platform pick the entity class for the target."""
+        routes = {}
+        if self.battery_state is not None:
+            routes[ChannelPlatform.SENSOR] = [(BATTERY_ROUTE, self)]
+        for channel in self.channels:
+            for platform in channel.type_info.platforms:
+                if channel.application_mode not in PLATFORM_APPLICATION_MODES[platform]:
+                    continue
+                functions = PLATFORM_OUTPUT_FUNCTIONS.get(platform)
+                if functions is None:
+                    routes.setdefault(platform, []).append(
+                        (channel.application_mode, channel)
+                    )
+                    continue
+                for output_function in channel.output_functions.values():
+                    if output_function["function"] in functions:
+                        routes.setdefault(platform, []).append(
+                            (output_function["function"], channel)
+                        )
+        return routes
+
+    def find_trigger_subtypes(self) -> list:
+        """Return the channel numbers that can be used as button event subtypes.
+        Rocker channels also use the channel number + 1 for the down button."""
+        if not any(isinstance(channel, SensorChannel) for channel in self.channels):
+            return []
+        subtypes = []
+        for channel in self.channels:
+            number = channel.channel["no"]
+            subtypes.append(str(number))
+            for output_function in channel.output_functions.values():
+                if output_function.get("typeID") in ["FT_INGBRS.GBR"]:
+                    subtypes.append(str(number + 1))
+        return subtypes
 
-        return ChannelUseType.UNSUPPORTED
+    def get_channel_use_type(self, device_channel):
+        """Determine if the channel is an actuator or a sensor"""
+        return ChannelTypeInfo.get(device_channel["channelTypeID"]).use_type
 
     def get_battery_state(self):
         return self.battery_state
@@ -536,6 +1390,98 @@ class Device:
             await self.client.setup_event_subscription(function_uid)
 
 
+class ChannelTypeInfo:
+    """Metadata shared by all channels of the same channel type (flyweight)
+
+    Also holds the classification of the channel type, so it is only derived
+    from the catalog once per type."""
+
+    __slots__ = (
+        "channel_type",
+        "meta_data",
+        "use_type",
+        "sub_section",
+        "platforms",
+        "input_device_functions",
+        "output_device_functions",
+        "device_parameters",
+    )
+
+    _instances: Dict[str, "ChannelTypeInfo"] = {}
+
+    def __init__(self, channel_type):
+        self.channel_type = channel_type
+        self.meta_data = enet_data.get_channel_meta_data_from_channel_type(channel_type)
+        config = CHANNEL_TYPE_CONFIGURATION.get(channel_type) or {}
+        # Map from enet function / parameter type id to ChannelTypeFunctionName
+        self.input_device_functions = self._invert(config.get("inputDeviceFunctions"))
+        self.output_device_functions = self._invert(
+            config.get("outputDeviceFunctions")
+        )
+        self.device_parameters = self._invert(config.get("deviceParameters"))
+        self.sub_section = self.meta_data.get("subSectionTypeID", "")
+        self.use_type = self._classify()
+        self.platforms = self._platforms()
+
+    def _classify(self) -> ChannelUseType:
+        """Determine if channels of this type are actuators or sensors"""
+        if self.channel_type in CHANNEL_TYPES_IGNORED:
+            return ChannelUseType.IGNORED
+
+        # CT_1F01_DUMMY has type None, but needs to be supported as well
+        use_type = self.meta_data.get("useTypeID", "")
+        if use_type == ChannelTypeUseType.ACTUATOR:
+            if self.sub_section in {
+                ChannelTypeSubSectionType.BLINDS,
+                ChannelTypeSubSectionType.LIGHT,
+            }:
+                return ChannelUseType.ACTUATOR
+            else:  # Special case for CT_1F19 energy sensor
+                return ChannelUseType.SENSOR
+        elif use_type == ChannelTypeUseType.SENSOR:
+            return ChannelUseType.SENSOR
+
+        return ChannelUseType.UNSUPPORTED
+
+    def _platforms(self) -> frozenset:
+        """Return the platforms channels of this type can be set up on"""
+        match self.use_type:
+            case ChannelUseType.ACTUATOR if (
+                self.sub_section == ChannelTypeSubSectionType.BLINDS
+            ):
+                return frozenset({ChannelPlatform.COVER})
+            case ChannelUseType.ACTUATOR:
+                return frozenset({ChannelPlatform.LIGHT, ChannelPlatform.SWITCH})
+            case ChannelUseType.SENSOR:
+                return frozenset({ChannelPlatform.SENSOR, ChannelPlatform.BINARY_SENSOR})
+        return frozenset()
+
+    @staticmethod
+    def _invert(channel_map):
+        if not channel_map:
+            return {}
+        return {value: key for key, value in channel_map.items()}
+
+    @classmethod
+    def get(cls, channel_type):
+        """Return the shared instance for channel_type"""
+        info = cls._instances.get(channel_type)
+        if info is None:
+            info = cls._instances[channel_type] = cls(channel_type)
+        return info
+
+    def get_mapped_type_ids(self, list_name) -> dict:
+        """Return the type id to function name map for a configuration group"""
+        match list_name:
+            case "inputDeviceFunctions":
+                return self.input_device_functions
+            case "outputDeviceFunctions":
+                return self.output_device_functions
+            case "deviceParameters":
+                return self.device_parameters
+        return {}
+
+
 class DeviceChannel:
     """A generic class representing a device channel"""
 
@@ -545,6 +1491,7 @@ class DeviceChannel:
         self.active = False
         self.uid = f"{self.device.uid}-{self.channel['no']}"
         self.channel_type = self.channel["channelTypeID"]
+        self.type_info = ChannelTypeInfo.get(self.channel_type)
         self.application_mode = ChannelApplicationMode.UNUSED
         self.name = self.channel["effectArea"]
         self.current_values = {}
@@ -611,10 +1558,7 @@ class DeviceChannel:
         return function_uids
 
     def _get_mapped_type_ids(self, list_name) -> dict:
-        channel_map = getitem_from_dict(
-            CHANNEL_TYPE_CONFIGURATION.get(self.channel_type), [list_name]
-        )
-        return {value: key for key, value in channel_map.items()}
+        return self.type_info.get_mapped_type_ids(list_name)
 
     def get_channel_type_function_name_from_output_function_uid(self, uid: str) -> str:
         output_function = self._get_output_function_by_uid(uid)
@@ -673,6 +1617,15 @@ class DeviceChannel:
         else:
             return [self._parse_value(value) for value in current_values]
 
+    def set_current_values_from_dict(self, type_id: str, function_object) -> bool:
+        """Update the value of output function type_id from a server response.
+        Returns True if the value changed"""
+        new_value = self._get_current_value_from_dict(function_object)
+        if self.current_values.get(type_id) == new_value:
+            return False
+        self.current_values[type_id] = new_value
+        return True
+
     def _parse_value(self, value_to_parse: dict) -> dict:
         value = value_to_parse.get("value", None)
         value_type_id = value_to_parse.get("valueTypeID", "")
@@ -718,8 +1671,12 @@ class DeviceChannel:
                     new_value = self._parse_value(value_container)
                     self.current_values[output_function.get("typeID")] = new_value
                     log.debug("Updating value of %s to %s", self.name, new_value)
-                for callback in self.on_update_callbacks:
-                    await callback()
+                await self.notify_update()
+
+    async def notify_update(self) -> None:
+        """Run the update callbacks of the channel, e.g. to write entity states"""
+        for callback in self.on_update_callbacks:
+            await callback()
 
     def get_current_value(self, channel_function_name: ChannelTypeFunctionName) -> Any:
         """Set channel to new value"""
@@ -783,7 +1740,10 @@ class ActuatorChannel(DeviceChannel):
             return current_value.get("value")
 
     async def set_value(
-        self, channel_function_name: ChannelTypeFunctionName, value=None
+        self,
+        channel_function_name: ChannelTypeFunctionName,
+        value=None,
+        priority=CommandPriority.INTERACTIVE,
     ) -> None:
         """Set channel to new value"""
         channel_config_id = self.get_channel_configuration_entry(
@@ -794,30 +1754,155 @@ class ActuatorChannel(DeviceChannel):
 
         params = {"deviceFunctionUID": input_function_uid, "values": []}
 
-        value_template = channel_config.get("template", []).copy()
+        # The template is shared with other channels, copy it before filling in values
+        value_template = [dict(value) for value in channel_config.get("template", [])]
 
         if value is not None:
             # try to cast to correct type...
             _type = type(value_template[0]["value"])
+            if _type is bool and isinstance(value, str):
+                # bool("off") is True
+                raise ValueError(
+                    f"{channel_function_name} expects true or false, got {value!r}"
+                )
             casted_value = _type(value)
             value_template[0]["value"] = casted_value
-            self.set_current_value(channel_function_name, casted_value)
+            confirm_uids = self._expect_value(channel_function_name, casted_value)
+            # The confirming event does not update the state again, so
+            # commands that do not come from an entity need the write here
+            await self.notify_update()
+        else:
+            confirm_uids = []
 
         params["values"] = value_template
 
-        await self.device.client.request(
-            URL.VISUALIZATION, "callInputDeviceFunction", params
+        commands = self.device.client.commands
+        coalesced_keys = [(self.uid, name) for name in COALESCED_FUNCTION_NAMES]
+        if channel_function_name in COALESCED_FUNCTION_NAMES:
+            await commands.submit(
+                (self.uid, channel_function_name),
+                functools.partial(
+                    self._call_input_function, params, priority, confirm_uids
+                ),
+            )
+            return
+
+        # Values still waiting to be sent are stale now, e.g. when stopping a cover
+        commands.discard(coalesced_keys)
+        await self._call_input_function(params, priority, confirm_uids)
+
+    def _expect_value(self, channel_function_name, value) -> list:
+        """Show value right away and track it until the server confirms it.
+        Returns the uids of the output functions that will confirm it"""
+        type_id = self.get_channel_configuration_entry(
+            "outputDeviceFunctions", channel_function_name
+        )
+        previous = self.current_values.get(type_id, {}).get("value")
+        self.set_current_value(channel_function_name, value)
+        output_function = self.output_functions.get(type_id)
+        if output_function is None or previous is None or self.device.client._offline:
+            # Nothing will confirm the value
+            return []
+        timeout = None
+        if channel_function_name in SLOW_CONFIRM_FUNCTION_NAMES:
+            timeout = COVER_CONFIRM_TIMEOUT
+        self.device.client.tracker.expect(
+            output_function["uid"], self, type_id, previous, value, timeout
+        )
+        return [output_function["uid"]]
+
+    async def _call_input_function(self, params, priority, confirm_uids):
+        """Send a command, its confirmation timeouts start once the scheduler
+        lets it through"""
+        client = self.device.client
+        started = False
+
+        def start():
+            nonlocal started
+            started = True
+            client.tracker.start(confirm_uids)
+
+        try:
+            return await client.request(
+                URL.VISUALIZATION,
+                "callInputDeviceFunction",
+                params,
+                priority=priority,
+                on_admitted=start,
+            )
+        except BaseException:
+            client.tracker.fail(confirm_uids, started)
+            raise
+
+    async def move_cover(
+        self, position=None, tilt_position=None, priority=CommandPriority.INTERACTIVE
+    ) -> None:
+        """Move a cover and/or its slats, both in percent.
+
+        Uses the combined position and slat function in a single command if the
+        channel has it, otherwise sends both position commands concurrently."""
+        channel_config_id = self.get_channel_configuration_entry(
+            "inputDeviceFunctions", ChannelTypeFunctionName.COVER_TILT_POSITION
+        )
+        channel_config = self.input_functions.get(channel_config_id)
+        if channel_config is None:
+            commands = []
+            if position is not None:
+                commands.append(
+                    self.set_value(
+                        ChannelTypeFunctionName.COVER_POSITION, position, priority
+                    )
+                )
+            if tilt_position is not None:
+                commands.append(
+                    self.set_value(
+                        ChannelTypeFunctionName.TILT_POSITION, tilt_position, priority
+                    )
+                )
+            await asyncio.gather(*commands)
+            return
+
+        # The template is shared with other channels, copy it before filling in values
+        values = [dict(value) for value in channel_config.get("template", [])]
+        for value in values:
+            match value["valueTypeID"]:
+                case "VT_VALID_HEIGHT_POS":
+                    value["value"] = position is not None
+                case "VT_VALID_SLATS_POS":
+                    value["value"] = tilt_position is not None
+                case "VT_HEIGHT_POSITION" if position is not None:
+                    value["value"] = int(position)
+                case "VT_SLATS_POSITION" if tilt_position is not None:
+                    value["value"] = int(tilt_position)
+
+        confirm_uids = []
+        for function_name, value in (
+            (ChannelTypeFunctionName.COVER_POSITION, position),
+            (ChannelTypeFunctionName.TILT_POSITION, tilt_position),
+        ):
+            output_id = self.get_channel_configuration_entry(
+                "outputDeviceFunctions", function_name
+            )
+            if value is not None and output_id in self.current_values:
+                confirm_uids += self._expect_value(function_name, int(value))
+        await self.notify_update()
+
+        # Pending single position commands are stale now
+        self.device.client.commands.discard(
+            [(self.uid, name) for name in COALESCED_FUNCTION_NAMES]
         )
+        params = {"deviceFunctionUID": channel_config["uid"], "values": values}
+        await self._call_input_function(params, priority, confirm_uids)
 
-    async def turn_off(self):
+    async def turn_off(self, priority=CommandPriority.INTERACTIVE):
         "Turn off device"
         log.info("%s turn_off()", self.name)
-        await self.set_value(ChannelTypeFunctionName.ON_OFF, False)
+        await self.set_value(ChannelTypeFunctionName.ON_OFF, False, priority)
 
-    async def turn_on(self):
+    async def turn_on(self, priority=CommandPriority.INTERACTIVE):
         "Turn on device"
         log.info("%s turn_on()", self.name)
-        await self.set_value(ChannelTypeFunctionName.ON_OFF, True)
+        await self.set_value(ChannelTypeFunctionName.ON_OFF, True, priority)
 
     def __repr__(self):
         return f"{self.__class__.__name__} (Name: {self.name} Type: {self.channel_type} Values: {self.current_values})"
@@ -3,21 +3,20 @@
 from __future__ import annotations
 
 import logging
-import asyncio
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from custom_components.enet.enet_data.enums import (
-    ChannelApplicationMode,
-    ChannelTypeFunctionName,
-)
+from custom_components.enet.enet_data.enums import ChannelTypeFunctionName
 
-from .aioenet import SensorChannel
-from .const import DOMAIN
+from .enums import ChannelPlatform
+from .const import DOMAIN, SIGNAL_DEVICES_ADDED
 from .entity import EnetBaseChannelEntity
+from .utils import add_entities_at_once
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,27 +25,24 @@ async def async_setup_entry(hass, entry, async_add_entities):
     """Add Enet binary sensor devices from a config entry."""
     hub = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[BinarySensorEntity] = []
-
-    for device in hub.devices:
-        for channel in device.channels:
-            if not isinstance(channel, SensorChannel):
-                continue
-
-            # eNet motion detectors use MOVEMENT application mode and typically
-            # report triggers via TRIGGER_START.
-            if channel.application_mode == ChannelApplicationMode.MOVEMENT:
-                for output_function in channel.output_functions.values():
-                    if (
-                        output_function["function"]
-                        == ChannelTypeFunctionName.TRIGGER_START
-                    ):
-                        entities.append(
-                            EnetMotionBinarySensor(channel, hub.coordinator)
-                        )
+    @callback
+    def async_add_devices(devices):
+        # eNet motion detectors use MOVEMENT application mode and typically
+        # report triggers via TRIGGER_START.
+        entities: list[BinarySensorEntity] = [
+            EnetMotionBinarySensor(channel, hub.coordinator)
+            for _kind, channel in hub.get_platform_routes(
+                ChannelPlatform.BINARY_SENSOR, devices
+            )
+        ]
+        add_entities_at_once(async_add_entities, entities)
 
-    if entities:
-        async_add_entities(entities)
+    async_add_devices(hub.devices)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), async_add_devices
+        )
+    )
 
     _LOGGER.info("Finished async setup(binary_sensor)")
 
@@ -73,7 +69,11 @@ class EnetMotionBinarySensor(EnetBaseChannelEntity, BinarySensorEntity):
         super().__init__(channel, coordinator)
         # Do not use value supplied by enet server on startup, only react to events
         self.update_value(0)
-        self._clear_motion_task = None
+
+    async def async_added_to_hass(self):
+        """Cancel a pending motion clear when the entity is removed."""
+        await super().async_added_to_hass()
+        self.async_on_remove(lambda: self.coordinator.timers.cancel(self))
 
     async def on_value_updated(self):
         self.async_write_ha_state()
@@ -85,12 +85,11 @@ class EnetMotionBinarySensor(EnetBaseChannelEntity, BinarySensorEntity):
                 self.name,
                 wait,
             )
-            if self._clear_motion_task is not None:
-                self._clear_motion_task.cancel()
-            self._clear_motion_task = asyncio.create_task(self.clear_motion(wait))
+            # Moves the deadline if motion is already detected
+            self.coordinator.timers.schedule(self, float(wait), self.clear_motion)
 
-    async def clear_motion(self, wait=10):
-        await asyncio.sleep(wait)
+    @callback
+    def clear_motion(self):
         _LOGGER.debug("%s: Clearing motion", self.name)
         self.update_value(0)
         self.async_write_ha_state()
@@ -8,13 +8,23 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.components import zeroconf
 
 from . import aioenet
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    CONF_PARAMETER_FILTER,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_COMMAND_WINDOW,
+    CONF_REQUEST_RATE,
+    CONF_CONFIRM_TIMEOUT,
+    DEFAULT_SENSOR_DEADBAND,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,6 +67,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Create the options flow."""
+        return OptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -131,6 +149,63 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Enet Smart Home options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_PARAMETER_FILTER,
+                        description={
+                            "suggested_value": self.config_entry.options.get(
+                                CONF_PARAMETER_FILTER, ""
+                            )
+                        },
+                    ): str,
+                    vol.Optional(
+                        CONF_SENSOR_DEADBAND,
+                        default=self.config_entry.options.get(
+                            CONF_SENSOR_DEADBAND, DEFAULT_SENSOR_DEADBAND
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                    vol.Optional(
+                        CONF_SENSOR_MIN_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_SENSOR_MIN_INTERVAL, DEFAULT_SENSOR_MIN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_COMMAND_WINDOW,
+                        default=self.config_entry.options.get(
+                            CONF_COMMAND_WINDOW, aioenet.COMMAND_WINDOW
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=5)),
+                    vol.Optional(
+                        CONF_REQUEST_RATE,
+                        default=self.config_entry.options.get(
+                            CONF_REQUEST_RATE, aioenet.REQUEST_RATE
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_CONFIRM_TIMEOUT,
+                        default=self.config_entry.options.get(
+                            CONF_CONFIRM_TIMEOUT, aioenet.CONFIRM_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1, max=300)),
+                }
+            ),
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
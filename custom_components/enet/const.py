@@ -1,5 +1,7 @@
 """Constants for the Enet Smart Home integration."""
 
+from datetime import timedelta
+
 DOMAIN = "enet"
 
 NAME_ENET_CONTROLLER = "Enet Controller"
@@ -7,8 +9,38 @@ NAME_ENET_SERVER = "Enet Smart Home Server"
 
 CONF_SUBTYPE = "subtype"
 CONF_UNIQUE_ID = "unique_id"
+CONF_PARAMETER_FILTER = "parameter_filter"
+CONF_SENSOR_DEADBAND = "sensor_deadband"
+CONF_SENSOR_MIN_INTERVAL = "sensor_min_interval"
+CONF_COMMAND_WINDOW = "command_window"
+CONF_REQUEST_RATE = "request_rate"
+CONF_CONFIRM_TIMEOUT = "confirm_timeout"
+
+# Measurement sensors: deadband in percent of the last written value, minimum
+# seconds between state writes and delay after which a held value is written
+DEFAULT_SENSOR_DEADBAND = 0.0
+DEFAULT_SENSOR_MIN_INTERVAL = 0
+SENSOR_FLUSH_DELAY = 300
 
 ATTR_ENET_EVENT = "enet_event"
 EVENT_TYPE_INITIAL_PRESS = "initial_press"
 EVENT_TYPE_SHORT_RELEASE = "short_release"
 EVENT_TYPE_LONG_RELEASE = "long_release"
+
+SIGNAL_DEVICES_ADDED = "enet_devices_added_{}"
+# Button events by device registry id, subtype and event type, sent with the
+# event data and the context of the enet_event
+SIGNAL_DEVICE_TRIGGER = "enet_device_trigger_{}_{}_{}"
+
+TOPOLOGY_REFRESH_INTERVAL = timedelta(hours=1)
+
+SERVICE_REFRESH_DEVICES = "refresh_devices"
+SERVICE_RESYNC_VALUES = "resync_values"
+SERVICE_SET_CHANNELS = "set_channels"
+SERVICE_SET_POSITION_AND_TILT = "set_position_and_tilt"
+ATTR_FULL = "full"
+ATTR_ITEMS = "items"
+ATTR_CHANNEL = "channel"
+ATTR_FUNCTION = "function"
+ATTR_VALUE = "value"
+ATTR_MAX_CONCURRENCY = "max_concurrency"
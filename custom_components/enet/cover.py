@@ -1,6 +1,8 @@
 """Enet Smart Home cover / blinds support"""
 
 import logging
+
+import voluptuous as vol
 from homeassistant.components.cover import (
     ATTR_POSITION,
     ATTR_TILT_POSITION,
@@ -8,11 +10,15 @@ from homeassistant.components.cover import (
     CoverEntityFeature,
     CoverDeviceClass
 )
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from custom_components.enet.enet_data.enums import ChannelApplicationMode, ChannelTypeFunctionName
+from custom_components.enet.enet_data.enums import ChannelTypeFunctionName
 from .entity import EnetBaseChannelEntity
-from .aioenet import ActuatorChannel
-from .const import DOMAIN
+from .enums import ChannelPlatform
+from .utils import add_entities_at_once
+from .const import DOMAIN, SERVICE_SET_POSITION_AND_TILT, SIGNAL_DEVICES_ADDED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,14 +27,40 @@ async def async_setup_entry(hass, entry, async_add_entities):
     """Add Enet cover devices from a config entry"""
     hub = hass.data[DOMAIN][entry.entry_id]
 
-    supported_app_modes = [
-        ChannelApplicationMode.BLINDS
-    ]
+    @callback
+    def async_add_devices(devices):
+        add_entities_at_once(
+            async_add_entities,
+            [
+                EnetCover(channel, hub.coordinator)
+                for _kind, channel in hub.get_platform_routes(
+                    ChannelPlatform.COVER, devices
+                )
+            ],
+        )
 
-    for device in hub.devices:
-        for channel in device.channels:
-            if isinstance(channel, ActuatorChannel) and channel.application_mode in supported_app_modes:
-                async_add_entities([EnetCover(channel, hub.coordinator)])
+    async_add_devices(hub.devices)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), async_add_devices
+        )
+    )
+
+    percentage = vol.All(vol.Coerce(int), vol.Range(min=0, max=100))
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_SET_POSITION_AND_TILT,
+        vol.All(
+            cv.make_entity_service_schema(
+                {
+                    vol.Optional(ATTR_POSITION): percentage,
+                    vol.Optional(ATTR_TILT_POSITION): percentage,
+                }
+            ),
+            cv.has_at_least_one_key(ATTR_POSITION, ATTR_TILT_POSITION),
+        ),
+        "async_set_position_and_tilt",
+    )
     _LOGGER.info("Finished async setup()")
 
 
@@ -95,46 +127,53 @@ class EnetCover(EnetBaseChannelEntity, CoverEntity):
 
     async def async_added_to_hass(self):
         """Subscribe entity to updates when added to hass."""
+        await super().async_added_to_hass()
         self.async_on_remove(
             self.coordinator.async_add_listener(self.async_write_ha_state)
         )
 
     async def async_close_cover(self, **kwargs) -> None:
         """Close the cover."""
-        await self.channel.set_value(ChannelTypeFunctionName.UP_DOWN, True)
-        self.async_write_ha_state()
+        await self.channel.set_value(ChannelTypeFunctionName.UP_DOWN, True, priority=self.command_priority)
 
     async def async_open_cover(self, **kwargs) -> None:
         """Open the cover."""
-        await self.channel.set_value(ChannelTypeFunctionName.UP_DOWN, False)
-        self.async_write_ha_state()
+        await self.channel.set_value(ChannelTypeFunctionName.UP_DOWN, False, priority=self.command_priority)
 
     async def async_set_cover_position(self, **kwargs) -> None:
         """Move the cover to a specific position."""
         enet_position = 100 - kwargs[ATTR_POSITION]
-        await self.channel.set_value(ChannelTypeFunctionName.COVER_POSITION, enet_position)
-        self.async_write_ha_state()
+        await self.channel.set_value(ChannelTypeFunctionName.COVER_POSITION, enet_position, priority=self.command_priority)
 
     async def async_stop_cover(self, **kwargs) -> None:
         """Stop the cover."""
-        await self.channel.set_value(ChannelTypeFunctionName.STOP)
-        self.async_write_ha_state()
+        await self.channel.set_value(ChannelTypeFunctionName.STOP, priority=self.command_priority)
 
     async def async_open_cover_tilt(self, **kwargs) -> None:
         """Open the cover tilt."""
-        await self.channel.set_value(ChannelTypeFunctionName.TILT_POSITION, 0)
-        self.async_write_ha_state()
+        await self.channel.set_value(ChannelTypeFunctionName.TILT_POSITION, 0, priority=self.command_priority)
 
     async def async_close_cover_tilt(self, **kwargs) -> None:
         """Close the cover tilt."""
-        await self.channel.set_value(ChannelTypeFunctionName.TILT_POSITION, 100)
-        self.async_write_ha_state()
+        await self.channel.set_value(ChannelTypeFunctionName.TILT_POSITION, 100, priority=self.command_priority)
 
     async def async_set_cover_tilt_position(self, **kwargs) -> None:
         """Move the cover tilt to a specific position."""
         enet_tilt_position = 100 - kwargs[ATTR_TILT_POSITION]
-        await self.channel.set_value(ChannelTypeFunctionName.TILT_POSITION, enet_tilt_position)
-        self.async_write_ha_state()
+        await self.channel.set_value(ChannelTypeFunctionName.TILT_POSITION, enet_tilt_position, priority=self.command_priority)
+
+    async def async_set_position_and_tilt(self, **kwargs) -> None:
+        """Move the cover and its slats to a position in one go."""
+        enet_position = enet_tilt_position = None
+        if ATTR_POSITION in kwargs:
+            enet_position = 100 - kwargs[ATTR_POSITION]
+        if ATTR_TILT_POSITION in kwargs and self._operation_mode == "BLINDS":
+            enet_tilt_position = 100 - kwargs[ATTR_TILT_POSITION]
+        if enet_position is None and enet_tilt_position is None:
+            return
+        await self.channel.move_cover(
+            enet_position, enet_tilt_position, priority=self.command_priority
+        )
 
     async def async_stop_cover_tilt(self, **kwargs) -> None:
         """Stop the cover."""
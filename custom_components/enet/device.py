@@ -2,28 +2,126 @@
 
 import logging
 
+from homeassistant.const import (
+    ATTR_MANUFACTURER,
+    ATTR_MODEL,
+    ATTR_NAME,
+    ATTR_SERIAL_NUMBER,
+    ATTR_SUGGESTED_AREA,
+)
 from homeassistant.core import callback
 from homeassistant.helpers import device_registry
-from .aioenet import ActuatorChannel
+from .const import DOMAIN, NAME_ENET_CONTROLLER
+from .device_trigger import build_device_triggers
 from .utils import get_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device info fields that are compared with the registry entry
+REGISTRY_FIELDS = (
+    ATTR_NAME,
+    ATTR_MANUFACTURER,
+    ATTR_MODEL,
+    ATTR_SERIAL_NUMBER,
+    ATTR_SUGGESTED_AREA,
+)
 
-async def async_setup_devices(coordinator):
-    """Manage setup of devices from Enet devices."""
+
+def device_entry_changed(device_entry, device_info) -> bool:
+    """Return True if the registry entry differs from the device info."""
+    return any(
+        (getattr(device_entry, field) or None) != (device_info.get(field) or None)
+        for field in REGISTRY_FIELDS
+    )
+
+
+def get_registry_uid(device_entry):
+    """Return the Enet device uid of a registry entry, None for other devices."""
+    return next(
+        (
+            identifier[1]
+            for identifier in device_entry.identifiers
+            if identifier[0] == DOMAIN
+            and identifier[1] != NAME_ENET_CONTROLLER
+            and ":" not in identifier[1]
+        ),
+        None,
+    )
+
+
+async def async_setup_devices(coordinator, devices=None):
+    """Sync the device registry and the trigger catalog with the Enet devices.
+
+    Only devices that are new or changed are written to the registry. If all
+    devices are synced, registry devices that no longer exist on the server are
+    removed."""
     entry = coordinator.config_entry
     hass = coordinator.hass
     dev_reg = device_registry.async_get(hass)
+    registry_entries = {
+        get_registry_uid(device_entry): device_entry
+        for device_entry in device_registry.async_entries_for_config_entry(
+            dev_reg, entry.entry_id
+        )
+    }
+    registry_entries.pop(None, None)
 
-    @callback
-    def add_device(enet_device):
-        """Register a Enet device in device registry."""
-        _LOGGER.debug("add_device() %s", enet_device)
-        params = get_device_info(enet_device)
-        return dev_reg.async_get_or_create(config_entry_id=entry.entry_id, **params)
-
-    # create/update all current devices found in controller ensuring devices that only generate events also gets registered
-    for enet_device in coordinator.hub.devices:
-        hass_device_entry = add_device(enet_device)
+    full_sync = devices is None
+    if full_sync:
+        devices = coordinator.hub.devices
+        coordinator.trigger_catalog.clear()
+    updated = 0
+    for enet_device in devices:
+        device_info = get_device_info(enet_device)
+        hass_device_entry = registry_entries.get(enet_device.uid)
+        if hass_device_entry is None or device_entry_changed(
+            hass_device_entry, device_info
+        ):
+            _LOGGER.debug("add_device() %s", enet_device)
+            hass_device_entry = dev_reg.async_get_or_create(
+                config_entry_id=entry.entry_id, **device_info
+            )
+            updated += 1
+        # Resolved once here, the event path uses the cached entry
         enet_device.hass_device_entry = hass_device_entry
+        async_update_trigger_catalog(coordinator, enet_device)
+
+    removed = 0
+    if full_sync:
+        # Keep devices that are known to the server but failed to load
+        known_uids = {raw["uid"] for raw in coordinator.hub._raw_json or []}
+        known_uids.update(device.uid for device in devices)
+        for uid, hass_device_entry in registry_entries.items():
+            if uid not in known_uids:
+                _LOGGER.debug("remove_device() %s", hass_device_entry.name)
+                dev_reg.async_remove_device(hass_device_entry.id)
+                removed += 1
+    _LOGGER.debug(
+        "Synced %d devices with the device registry, %d updated, %d removed",
+        len(devices),
+        updated,
+        removed,
+    )
+
+
+@callback
+def async_update_trigger_catalog(coordinator, enet_device):
+    """Store the device triggers of an Enet device by device registry id."""
+    device_id = enet_device.hass_device_entry.id
+    triggers = build_device_triggers(device_id, enet_device)
+    if triggers:
+        coordinator.trigger_catalog[device_id] = triggers
+    else:
+        coordinator.trigger_catalog.pop(device_id, None)
+
+
+@callback
+def async_remove_devices(coordinator, devices):
+    """Remove Enet devices that no longer exist from the device registry."""
+    dev_reg = device_registry.async_get(coordinator.hass)
+    for enet_device in devices:
+        hass_device_entry = getattr(enet_device, "hass_device_entry", None)
+        if hass_device_entry is not None:
+            _LOGGER.debug("remove_device() %s", enet_device)
+            coordinator.trigger_catalog.pop(hass_device_entry.id, None)
+            dev_reg.async_remove_device(hass_device_entry.id)
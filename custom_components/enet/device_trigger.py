@@ -6,17 +6,16 @@ import logging
 import voluptuous as vol
 
 from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
-from homeassistant.components.homeassistant.triggers import event as event_trigger
 from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
 
 
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Context, Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers import device_registry
 
-from .const import DOMAIN, ATTR_ENET_EVENT, EVENT_TYPE_INITIAL_PRESS, EVENT_TYPE_SHORT_RELEASE, EVENT_TYPE_LONG_RELEASE, CONF_UNIQUE_ID, CONF_SUBTYPE
-from .aioenet import SensorChannel
+from .const import DOMAIN, ATTR_ENET_EVENT, EVENT_TYPE_INITIAL_PRESS, EVENT_TYPE_SHORT_RELEASE, EVENT_TYPE_LONG_RELEASE, CONF_UNIQUE_ID, CONF_SUBTYPE, SIGNAL_DEVICE_TRIGGER
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,43 +41,30 @@ async def async_get_triggers(
     device_entry = device_registry.async_get(hass).async_get(device_id)
     entry_id = [i for i in device_entry.config_entries][0]
     hub = hass.data[DOMAIN][entry_id]
-    triggers = []
-
-    enet_device_id = get_enet_device_id(device_entry)
-    enet_device = next(
-        (d for d in hub.devices if d.uid == enet_device_id), None)
-    _LOGGER.debug("Enet Trigger device: %s", enet_device)
-
-    # if not isinstance(enet_device, Sensor):
-    if not any([isinstance(c, SensorChannel) for c in enet_device.channels]):
-        return
-
-    channel_numbers = []
-
-    for channel in enet_device.channels:
-        number = channel.channel["no"]
-        channel_numbers.append(number)
-        # If rocker switch, also add channel number + 1
-        for output_function in channel.output_functions.values():
-            if output_function.get("typeID") in ["FT_INGBRS.GBR"]:
-                channel_numbers.append(number + 1)
-
-    for channel_no in channel_numbers:
-        for event_type in BUTTON_EVENT_TYPES:
-            triggers.append(
-                {
-                    CONF_DEVICE_ID: device_entry.id,
-                    CONF_DOMAIN: DOMAIN,
-                    CONF_PLATFORM: "device",
-                    CONF_TYPE: event_type,
-                    CONF_SUBTYPE: str(channel_no),
-                    CONF_UNIQUE_ID: enet_device.uid,
-                }
-            )
+    # The caller may add to the trigger dicts, hand out copies
+    triggers = [
+        dict(trigger) for trigger in hub.coordinator.trigger_catalog.get(device_id, [])
+    ]
     _LOGGER.debug("Triggers: %s", triggers)
     return triggers
 
 
+def build_device_triggers(hass_device_id: str, enet_device) -> list[dict[str, Any]]:
+    """Return the device triggers of an Enet device."""
+    return [
+        {
+            CONF_DEVICE_ID: hass_device_id,
+            CONF_DOMAIN: DOMAIN,
+            CONF_PLATFORM: "device",
+            CONF_TYPE: event_type,
+            CONF_SUBTYPE: subtype,
+            CONF_UNIQUE_ID: enet_device.uid,
+        }
+        for subtype in enet_device.trigger_subtypes
+        for event_type in BUTTON_EVENT_TYPES
+    ]
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config: ConfigType,
@@ -86,21 +72,32 @@ async def async_attach_trigger(
     trigger_info: TriggerInfo,
 ) -> CALLBACK_TYPE:
     """Attach a trigger."""
-    event_config = event_trigger.TRIGGER_SCHEMA(
-        {
-            event_trigger.CONF_PLATFORM: "event",
-            event_trigger.CONF_EVENT_TYPE: ATTR_ENET_EVENT,
-            event_trigger.CONF_EVENT_DATA: {
-                CONF_DEVICE_ID: config[CONF_DEVICE_ID],
-                CONF_TYPE: config[CONF_TYPE],
-                CONF_SUBTYPE: config[CONF_SUBTYPE],
+    job = HassJob(action)
+    trigger_data = trigger_info["trigger_data"]
+
+    @callback
+    def async_handle_event(event_data: dict[str, Any], context: Context) -> None:
+        """Run the action, with the same trigger variables and context as an
+        event trigger."""
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_data,
+                    **config,
+                    CONF_PLATFORM: "device",
+                    "event": Event(ATTR_ENET_EVENT, event_data, context=context),
+                    "description": f"event '{ATTR_ENET_EVENT}'",
+                }
             },
-        }
-    )
-    _LOGGER.debug("Attaching trigger: %s", event_config)
-    return await event_trigger.async_attach_trigger(
-        hass, event_config, action, trigger_info, platform_type="device"
+            context,
+        )
+
+    signal = SIGNAL_DEVICE_TRIGGER.format(
+        config[CONF_DEVICE_ID], str(config[CONF_SUBTYPE]), config[CONF_TYPE]
     )
+    _LOGGER.debug("Attaching trigger: %s", signal)
+    return async_dispatcher_connect(hass, signal, async_handle_event)
 
 
 def get_enet_device_id(device_entry):
@@ -6,6 +6,7 @@ from typing import Any
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from .const import DOMAIN
+from .enet_data.data import enet_data
 
 
 async def async_get_config_entry_diagnostics(
@@ -14,6 +15,10 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     hub = hass.data[DOMAIN][config_entry.entry_id]
     diagnostics = {"config_entry": config_entry.as_dict(),
-                   "enet_data":hub._raw_json}
+                   "enet_data":hub._raw_json,
+                   "enet_data_cache_stats": enet_data.cache_stats(),
+                   "setup_timings": hub.coordinator.setup_timings,
+                   "request_scheduler": hub.scheduler.metrics(),
+                   "command_tracker": hub.tracker.metrics()}
 
     return diagnostics
@@ -1,6 +1,6 @@
 """Constants for enet_data."""
 
-CHANNEL_TYPES_IGNORED = (
+CHANNEL_TYPES_IGNORED = frozenset((
 
     "CT_DISABLED", # CH_Disabled
     "CT_DEVICE", # CH_IN_Device_Settings
@@ -11,4 +11,4 @@ CHANNEL_TYPES_IGNORED = (
     "CT_TADO_ZAC", # CH_TADO_Zone_Air_Conditioning
     "CT_TADO_ZH", # CH_TADO_Zone_Heating
     "CT_TADO_ZHW" # CH_TADO_Zone_Hot_Water
-)
+))
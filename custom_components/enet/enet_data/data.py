@@ -2,10 +2,11 @@
 import json
 import os
 import asyncio
+import time
 from typing import Dict, Any, List
 import logging
 
-from .utils import getitem_from_dict
+from .utils import getitem_from_dict, intern_strings, LookupCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,18 +62,53 @@ class EnetData:
         self._manufacturers: Dict[str, Dict] = {}
         self._value_type_container_types: Dict[str, Dict] = {}
         self._value_types: Dict[str, Dict] = {}
+        self._load_timings: Dict[str, float] = {}
+        self._device_type_records = LookupCache(self._build_device_type_record)
+        self._input_function_templates = LookupCache(self._build_input_device_function_template)
+        self._device_parameter_templates = LookupCache(self._build_device_parameter_template)
+
+    @property
+    def load_timings(self) -> Dict[str, float]:
+        """Returns the time in seconds spent reading and parsing each JSON file."""
+        return self._load_timings
 
     async def init_data(self) -> None:
         """Initializes the EnetData instance and loads data from JSON files."""
         _LOGGER.debug("Initializing EnetData...")
-        await self.import_channel_types()
-        await self.import_device_function_types()
-        await self.import_device_parameter_types()
-        await self.import_device_types()
-        await self.import_manufacturers()
-        await self.import_value_type_container_types()
-        await self.import_value_types()
-        _LOGGER.debug("EnetData initialization complete.")
+        start = time.perf_counter()
+        # The files are independent, so read and parse them concurrently in the
+        # default thread pool instead of waiting for one file after the other.
+        await asyncio.gather(
+            self.import_channel_types(),
+            self.import_device_function_types(),
+            self.import_device_parameter_types(),
+            self.import_device_types(),
+            self.import_manufacturers(),
+            self.import_value_type_container_types(),
+            self.import_value_types(),
+        )
+        self.clear_lookup_caches()
+        for type_id in self._device_types:
+            self._device_type_records.get(type_id)
+        _LOGGER.debug(
+            "EnetData initialization complete in %.3fs (%s)",
+            time.perf_counter() - start,
+            ", ".join(f"{name}: {duration:.3f}s" for name, duration in self._load_timings.items()),
+        )
+
+    def clear_lookup_caches(self) -> None:
+        """Drops all memoized lookups, needed if the catalog dictionaries change."""
+        self._device_type_records.clear()
+        self._input_function_templates.clear()
+        self._device_parameter_templates.clear()
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Returns size, hits and misses of the memoized lookups."""
+        return {
+            "device_types": self._device_type_records.stats(),
+            "input_device_function_templates": self._input_function_templates.stats(),
+            "device_parameter_templates": self._device_parameter_templates.stats(),
+        }
 
     def get_channel_type_by_id(self, type_id: str) -> Dict:
         """Returns the channel type dictionary for the given ID."""
@@ -88,7 +124,13 @@ class EnetData:
         return self._input_device_function_types.get(type_id, {})
 
     def get_value_template_from_input_device_function(self, type_id: str) -> list:
-        """Returns the value template list for the given ID."""
+        """Returns the value template list for the given ID.
+
+        The list is shared between all callers and must not be modified.
+        """
+        return self._input_function_templates.get(type_id)
+
+    def _build_input_device_function_template(self, type_id: str) -> list:
         function_type = self.get_input_device_function_type_by_id(type_id)
         return self.get_value_template_from_value_container(function_type.get("valueTypeContainerTypeID"))
 
@@ -113,7 +155,13 @@ class EnetData:
         return self.get_device_parameter_type_by_id(type_id).get("name", "Unknown")
 
     def get_value_template_from_device_parameter(self, type_id: str) -> list:
-        """Returns the value template list for the given ID."""
+        """Returns the value template list for the given ID.
+
+        The list is shared between all callers and must not be modified.
+        """
+        return self._device_parameter_templates.get(type_id)
+
+    def _build_device_parameter_template(self, type_id: str) -> list:
         function_type = self.get_device_parameter_type_by_id(type_id)
         return self.get_value_template_from_value_container(function_type.get("valueTypeContainerTypeID"))
 
@@ -123,8 +171,7 @@ class EnetData:
 
     def get_device_name_from_device_type_id(self, type_id: str) -> str:
         """Returns the device name for the given device type ID."""
-        device_type = self.get_device_type_by_id(type_id)
-        return getitem_from_dict(device_type, ["metaData", "name"])
+        return self._device_type_records.get(type_id)["name"]
 
     def get_manufacturer_by_id(self, manufacturer_id: str) -> Dict:
         """Returns the manufacturer dictionary for the given ID."""
@@ -138,8 +185,14 @@ class EnetData:
 
     def get_manufacturer_name_from_device_type_id(self, type_id: str) -> str:
         """Returns the manufacturer dictionary for the given device type ID."""
-        manufacturer = self.get_manufacturer_from_device_type_id(type_id)
-        return manufacturer.get("name")
+        return self._device_type_records.get(type_id)["manufacturer_name"]
+
+    def _build_device_type_record(self, type_id: str) -> Dict[str, Any]:
+        device_type = self.get_device_type_by_id(type_id)
+        return {
+            "name": getitem_from_dict(device_type, ["metaData", "name"]),
+            "manufacturer_name": self.get_manufacturer_from_device_type_id(type_id).get("name"),
+        }
 
     def get_value_type_container_type_by_id(self, type_id: str) -> Dict:
         """Returns the value type container type dictionary for the given ID."""
@@ -223,11 +276,14 @@ class EnetData:
             raise FileNotFoundError(f"The file {file_path} does not exist.")
 
         def read_file() -> Dict[str, Any]:
+            start = time.perf_counter()
             try:
                 with open(file_path, 'r', encoding="utf-8") as file:
-                    return json.load(file)
+                    return intern_strings(json.load(file))
             except FileNotFoundError as e:
                 raise FileNotFoundError(f"Error reading file {file_path}: {e}") from e
+            finally:
+                self._load_timings[file_name] = time.perf_counter() - start
 
         json_data = await asyncio.to_thread(read_file)
         return json_data
@@ -1,6 +1,8 @@
 '''Utility functions for the Enet Smart Home configuration settings.'''
+import sys
 from functools import reduce
 from operator import getitem
+from typing import Any, Callable, Dict
 
 def getitem_from_dict(data_dict, map_list):
     """Iterate nested dictionary"""
@@ -11,6 +13,26 @@ def getitem_from_dict(data_dict, map_list):
     except KeyError:
         return None
 
+def intern_strings(data):
+    """Intern all string values of a parsed JSON structure in place.
+
+    The catalog and the device payload repeat the same type IDs and names
+    thousands of times, interning makes them share a single object. Keys are
+    left alone since the json module already shares them within a document.
+    """
+    intern = sys.intern
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        items = node.items() if type(node) is dict else enumerate(node)
+        for key, value in items:
+            value_type = type(value)
+            if value_type is str:
+                node[key] = intern(value)
+            elif value_type is dict or value_type is list:
+                stack.append(value)
+    return data
+
 def filter_device_parameter_type_ids(data):
     """Filter device parameter type IDs from device channels."""
     filtered_ids = {}
@@ -19,3 +41,34 @@ def filter_device_parameter_type_ids(data):
         parameter_ids = channel.get("deviceParameterTypeIDs", [])
         filtered_ids[channel_id] = [pid for pid in parameter_ids if not any(sub in pid for sub in [".SCV1", ".SCV2", ".SNA"])]
     return filtered_ids
+
+
+class LookupCache:
+    """Memoize a catalog lookup per type ID and keep hit/miss statistics."""
+
+    def __init__(self, build: Callable[[str], Any]) -> None:
+        self._build = build
+        self._records: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, type_id: str) -> Any:
+        """Return the record for type_id, building it on first use."""
+        try:
+            record = self._records[type_id]
+        except KeyError:
+            self.misses += 1
+            record = self._records[type_id] = self._build(type_id)
+        else:
+            self.hits += 1
+        return record
+
+    def clear(self) -> None:
+        """Drop all records and reset the statistics."""
+        self._records.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the cache statistics."""
+        return {"size": len(self._records), "hits": self.hits, "misses": self.misses}
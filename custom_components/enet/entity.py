@@ -2,11 +2,22 @@
 
 import logging
 from homeassistant.helpers.entity import Entity
+from .aioenet import CommandPriority
 from .utils import get_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def get_command_priority(context):
+    """Return the scheduler priority for commands sent in a service call context.
+
+    Calls made by a user are interactive, automations and scripts without a
+    user are not."""
+    if context is not None and context.user_id is not None:
+        return CommandPriority.INTERACTIVE
+    return CommandPriority.AUTOMATION
+
+
 class EnetBaseEntity(Entity):
     """Generic Entity Class for Enet Smart Home entities"""
 
@@ -20,6 +31,24 @@ class EnetBaseEntity(Entity):
         """Return the polling state. False means the entity will only update when it has new data."""
         return False
 
+    @property
+    def enet_device(self):
+        """Return the Enet device the entity belongs to, if any."""
+        return None
+
+    @property
+    def command_priority(self):
+        """Return the scheduler priority of commands for the current service call."""
+        return get_command_priority(self._context)
+
+    async def async_added_to_hass(self):
+        """Register entity with the coordinator so it can be removed on topology changes."""
+        if self.enet_device is None:
+            return
+        self.async_on_remove(
+            self.coordinator.async_register_entity(self.enet_device.uid, self)
+        )
+
 
 class EnetBaseChannelEntity(EnetBaseEntity, Entity):
     """Generic Entity Class for Enet Smart Home channel"""
@@ -47,6 +76,11 @@ class EnetBaseChannelEntity(EnetBaseEntity, Entity):
             return f"{self._name} {sensor_name}"
         return self._name
 
+    @property
+    def enet_device(self):
+        """Return the Enet device the entity belongs to."""
+        return self.channel.device
+
     @property
     def device_info(self):
         """Return the device information."""
@@ -73,6 +107,11 @@ class EnetBaseDeviceEntity(EnetBaseEntity, Entity):
         self.device = device
         self.coordinator = coordinator
 
+    @property
+    def enet_device(self):
+        """Return the Enet device the entity belongs to."""
+        return self.device
+
     @property
     def device_info(self):
         """Return the device information."""
@@ -9,3 +9,12 @@ class ChannelUseType(StrEnum):
     SENSOR = "SENSOR"
     IGNORED = "IGNORED"
     UNSUPPORTED = "UNSUPPORTED"
+
+@unique
+class ChannelPlatform(StrEnum):
+    """Home Assistant platforms a channel can be set up on, same values as homeassistant.const.Platform."""
+    BINARY_SENSOR = "binary_sensor"
+    COVER = "cover"
+    LIGHT = "light"
+    SENSOR = "sensor"
+    SWITCH = "switch"
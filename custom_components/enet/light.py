@@ -3,13 +3,16 @@ import logging
 from typing import Optional
 
 from homeassistant.components.light import ColorMode, LightEntity
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.util.scaling import scale_ranged_value_to_int_range
 
 from custom_components.enet.enet_data.enums import ChannelApplicationMode, ChannelTypeFunctionName
 
 from .entity import EnetBaseChannelEntity
-from .aioenet import ActuatorChannel
-from .const import DOMAIN
+from .enums import ChannelPlatform
+from .utils import add_entities_at_once
+from .const import DOMAIN, SIGNAL_DEVICES_ADDED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,15 +21,24 @@ async def async_setup_entry(hass, entry, async_add_entities):
     """Add Enet light devices from a config entry"""
     hub = hass.data[DOMAIN][entry.entry_id]
 
-    supported_app_modes = [
-        ChannelApplicationMode.LIGHT_SWITCHING,
-        ChannelApplicationMode.LIGHT_DIMMING,
-    ]
+    @callback
+    def async_add_devices(devices):
+        add_entities_at_once(
+            async_add_entities,
+            [
+                EnetLight(channel, hub.coordinator)
+                for _kind, channel in hub.get_platform_routes(
+                    ChannelPlatform.LIGHT, devices
+                )
+            ],
+        )
 
-    for device in hub.devices:
-        for channel in device.channels:
-            if isinstance(channel, ActuatorChannel) and channel.application_mode in supported_app_modes:
-                async_add_entities([EnetLight(channel, hub.coordinator)])
+    async_add_devices(hub.devices)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), async_add_devices
+        )
+    )
     _LOGGER.info("Finished async setup()")
 
 
@@ -63,6 +75,7 @@ class EnetLight(EnetBaseChannelEntity, LightEntity):
 
     async def async_added_to_hass(self):
         """Subscribe entity to updates when added to hass."""
+        await super().async_added_to_hass()
         self.async_on_remove(
             self.coordinator.async_add_listener(self.async_write_ha_state)
         )
@@ -77,13 +90,13 @@ class EnetLight(EnetBaseChannelEntity, LightEntity):
                 (1, 100),
                 brightness,
             )
-            await self.channel.set_value(ChannelTypeFunctionName.BRIGHTNESS, value)
+            await self.channel.set_value(
+                ChannelTypeFunctionName.BRIGHTNESS, value, self.command_priority
+            )
         else:
-            await self.channel.turn_on()
-        self.async_write_ha_state()
+            await self.channel.turn_on(self.command_priority)
 
     async def async_turn_off(self, **kwargs):
         """Turn the light off."""
         _LOGGER.info("async_turn_off: (%s) %s", self.name, kwargs)
-        await self.channel.turn_off()
-        self.async_write_ha_state()
+        await self.channel.turn_off(self.command_priority)
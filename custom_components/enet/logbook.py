@@ -8,7 +8,7 @@ from homeassistant.const import CONF_DEVICE_ID, CONF_ID, CONF_TYPE
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 
-from .const import ATTR_ENET_EVENT, CONF_SUBTYPE, DOMAIN
+from .const import ATTR_ENET_EVENT, CONF_SUBTYPE, CONF_UNIQUE_ID, DOMAIN
 
 TRIGGER_SUBTYPE = {
     "1": "Button 1",
@@ -36,21 +36,40 @@ def async_describe_events(
     async_describe_event: Callable[[str, str, Callable[[Event], dict[str, str]]], None],
 ) -> None:
     """Describe enet logbook events."""
+    device_names: dict[str, str | None] = {}
+    messages: dict[tuple[str, str], str] = {}
+
+    @callback
+    def async_device_registry_updated(event: Event) -> None:
+        """Forget the cached name of a device that was changed or removed."""
+        device_names.pop(event.data["device_id"], None)
+
+    hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, async_device_registry_updated)
+
+    def get_device_name(device_id: str) -> str | None:
+        if device_id not in device_names:
+            dev_ent = dr.async_get(hass).async_get(device_id)
+            device_names[device_id] = dev_ent.name if dev_ent else None
+        return device_names[device_id]
+
+    def get_message(event_type: str, subtype: str) -> str:
+        key = (event_type, subtype)
+        if key not in messages:
+            messages[key] = TRIGGER_TYPE.get(event_type, UNKNOWN_TYPE).format(
+                subtype=TRIGGER_SUBTYPE.get(subtype, UNKNOWN_SUB_TYPE)
+            )
+        return messages[key]
 
     @callback
     def async_describe_enet_event(event: Event) -> dict[str, str]:
         """Describe enet logbook event."""
         data = event.data
-        name: str | None = None
-        if dev_ent := dr.async_get(hass).async_get(data[CONF_DEVICE_ID]):
-            name = dev_ent.name
+        name = get_device_name(data[CONF_DEVICE_ID])
         if name is None:
-            name = data[CONF_ID]
+            name = data.get(CONF_ID, data.get(CONF_UNIQUE_ID))
+        message = UNKNOWN_TYPE
         if CONF_TYPE in data:  # v2
-            subtype = TRIGGER_SUBTYPE.get(str(data[CONF_SUBTYPE]), UNKNOWN_SUB_TYPE)
-            message = TRIGGER_TYPE.get(data[CONF_TYPE], UNKNOWN_TYPE).format(
-                subtype=subtype
-            )
+            message = get_message(data[CONF_TYPE], str(data[CONF_SUBTYPE]))
         return {
             LOGBOOK_ENTRY_NAME: name,
             LOGBOOK_ENTRY_MESSAGE: message,
@@ -9,6 +9,8 @@ from homeassistant.const import (
 )
 
 from .const import DOMAIN, NAME_ENET_CONTROLLER, NAME_ENET_SERVER
+from .entity import get_command_priority
+from .utils import add_entities_at_once
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,11 +19,19 @@ async def async_setup_entry(hass, entry, async_add_entities):
     """Add Enet scenes"""
     hub = hass.data[DOMAIN][entry.entry_id]
 
-    scenes = await hub.get_scenes()
-    for scene_name in scenes:
-        scene_entity = EnetSceneEntity(hub, scene_name, scenes[scene_name])
-        async_add_entities([scene_entity])
+    async def async_add_scenes():
+        """Fetch the scenes without holding up the setup of the other platforms."""
+        try:
+            scenes = await hub.coordinator.async_timed("scenes", hub.get_scenes())
+        except Exception as e:
+            _LOGGER.warning("Failed to get Enet scenes: %s", e)
+            return
+        add_entities_at_once(
+            async_add_entities,
+            [EnetSceneEntity(hub, scene_name, uid) for scene_name, uid in scenes.items()],
+        )
 
+    entry.async_create_background_task(hass, async_add_scenes(), "enet_get_scenes")
     _LOGGER.info("Finished async setup()")
 
 
@@ -49,7 +59,7 @@ class EnetSceneEntity(SceneEntity):
 
     async def async_activate(self, **kwargs):
         """Activate Enet scene."""
-        await self.hub.activate_scene(self.uid)
+        await self.hub.activate_scene(self.uid, get_command_priority(self._context))
 
     @property
     def device_info(self) -> DeviceInfo:
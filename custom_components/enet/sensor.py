@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import logging
+import time
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -17,16 +18,27 @@ from homeassistant.const import (
     UnitOfElectricPotential,
     UnitOfPower,
 )  # , UnitOfReactivePower
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from custom_components.enet.enet_data.enums import (
-    ChannelApplicationMode,
     ChannelTypeFunctionName,
     DeviceBatteryState,
 )
 
+from .aioenet import BATTERY_ROUTE
 from .entity import EnetBaseChannelEntity, EnetBaseDeviceEntity
-from .aioenet import SensorChannel
-from .const import DOMAIN
+from .enums import ChannelPlatform
+from .utils import add_entities_at_once
+from .const import (
+    DOMAIN,
+    SIGNAL_DEVICES_ADDED,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_MIN_INTERVAL,
+    DEFAULT_SENSOR_DEADBAND,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    SENSOR_FLUSH_DELAY,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,65 +47,113 @@ async def async_setup_entry(hass, entry, async_add_entities):
     """Add Enet sensor devices from a config entry"""
     hub = hass.data[DOMAIN][entry.entry_id]
 
-    supported_app_modes = [
-        ChannelApplicationMode.SCENE,
-        ChannelApplicationMode.ENERGY,
-        ChannelApplicationMode.MOVEMENT,
-    ]
-
-    for device in hub.devices:
-        if device.get_battery_state() is not None:
-            async_add_entities([EnetBatterySensor(device, hub.coordinator)])
-        for channel in device.channels:
-            if (
-                isinstance(channel, SensorChannel)
-                and channel.application_mode in supported_app_modes
-            ):
-                for output_function in channel.output_functions.values():
-                    match output_function["function"]:
-                        case ChannelTypeFunctionName.BRIGHTNESS:
-                            async_add_entities(
-                                [EnetLightLevelSensor(channel, hub.coordinator)]
-                            )
-                        case ChannelTypeFunctionName.ENERGY_ACTIVE:
-                            async_add_entities(
-                                [EnetEnergySensor(channel, hub.coordinator)]
-                            )
-                        case ChannelTypeFunctionName.VOLTAGE:
-                            async_add_entities(
-                                [EnetVoltageSensor(channel, hub.coordinator)]
-                            )
-                        case ChannelTypeFunctionName.CURRENT:
-                            async_add_entities(
-                                [EnetCurrentSensor(channel, hub.coordinator)]
-                            )
-                        case ChannelTypeFunctionName.POWER_ACTIVE:
-                            async_add_entities(
-                                [EnetPowerSensor(channel, hub.coordinator)]
-                            )
-                        case ChannelTypeFunctionName.SCENE_CONTROL:
-                            # Handled as device action
-                            pass
-                        case _:
-                            _LOGGER.debug(
-                                "Unsupported output function: %s",
-                                output_function["function"],
-                            )
-
-                # channel_type_brightness = channel.get_channel_configuration_entry(
-                #    "outputDeviceFunctions", ChannelTypeFunctionName.BRIGHTNESS)
-                # Check if brightness is supported by channel, since light sensor provides one off spec channel without brightness
-                # if (
-                #    channel_type_brightness is not None
-                #    and channel_type_brightness in channel.current_values
-                # ):
-                #    async_add_entities(
-                #        [EnetLightLevelSensor(channel, hub.coordinator)])
+    entity_classes = {
+        BATTERY_ROUTE: EnetBatterySensor,
+        ChannelTypeFunctionName.BRIGHTNESS: EnetLightLevelSensor,
+        ChannelTypeFunctionName.ENERGY_ACTIVE: EnetEnergySensor,
+        ChannelTypeFunctionName.VOLTAGE: EnetVoltageSensor,
+        ChannelTypeFunctionName.CURRENT: EnetCurrentSensor,
+        ChannelTypeFunctionName.POWER_ACTIVE: EnetPowerSensor,
+    }
+
+    @callback
+    def async_add_devices(devices):
+        add_entities_at_once(
+            async_add_entities,
+            [
+                entity_classes[kind](target, hub.coordinator)
+                for kind, target in hub.get_platform_routes(
+                    ChannelPlatform.SENSOR, devices
+                )
+            ],
+        )
+
+    async_add_devices(hub.devices)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), async_add_devices
+        )
+    )
 
     _LOGGER.info("Finished async setup(sensor)")
 
 
-class EnetPowerSensor(EnetBaseChannelEntity, SensorEntity):
+class EnetMeasurementSensor(EnetBaseChannelEntity, SensorEntity):
+    """Base class for Enet sensors that only write changed values.
+
+    Identical values are never written. Values within the deadband of the last
+    written value and values arriving within the minimum interval are held
+    back, the latest held value is written once the interval has passed or
+    after SENSOR_FLUSH_DELAY."""
+
+    def __init__(self, channel, coordinator):
+        super().__init__(channel, coordinator)
+        options = coordinator.config_entry.options
+        self._deadband = (
+            options.get(CONF_SENSOR_DEADBAND, DEFAULT_SENSOR_DEADBAND) / 100
+        )
+        self._min_interval = options.get(
+            CONF_SENSOR_MIN_INTERVAL, DEFAULT_SENSOR_MIN_INTERVAL
+        )
+        self._written_value = None
+        self._last_write = 0.0
+
+    async def async_added_to_hass(self):
+        """Cancel a pending write when the entity is removed."""
+        await super().async_added_to_hass()
+        self._written_value = self._current_value()
+        self._last_write = time.monotonic()
+        self.async_on_remove(lambda: self.coordinator.timers.cancel(self))
+
+    def _current_value(self):
+        try:
+            return self.native_value
+        except Exception:
+            return None
+
+    def _within_deadband(self, value) -> bool:
+        if not self._deadband:
+            return False
+        try:
+            last = float(self._written_value)
+            return abs(float(value) - last) < abs(last) * self._deadband
+        except (TypeError, ValueError):
+            return False
+
+    async def on_value_updated(self) -> None:
+        """Write the state if the value changed enough and the interval passed."""
+        value = self._current_value()
+        if value == self._written_value:
+            self.coordinator.timers.cancel(self)
+            return
+        if self._within_deadband(value):
+            # Keep the pending deadline, so a held value is written at a fixed
+            # time after it arrived even if more values keep coming
+            if self not in self.coordinator.timers:
+                self.coordinator.timers.schedule(
+                    self, max(self._min_interval, SENSOR_FLUSH_DELAY), self._flush
+                )
+            return
+        wait = self._last_write + self._min_interval - time.monotonic()
+        if wait > 0:
+            self.coordinator.timers.schedule(self, wait, self._flush)
+            return
+        self._write_state(value)
+
+    @callback
+    def _flush(self) -> None:
+        value = self._current_value()
+        if value != self._written_value:
+            self._write_state(value)
+
+    def _write_state(self, value) -> None:
+        self.coordinator.timers.cancel(self)
+        self._written_value = value
+        self._last_write = time.monotonic()
+        self.async_write_ha_state()
+
+
+class EnetPowerSensor(EnetMeasurementSensor):
     """Representation of a Enet Power Active sensor."""
 
     _attr_native_unit_of_measurement = UnitOfPower.WATT
@@ -103,7 +163,7 @@ class EnetPowerSensor(EnetBaseChannelEntity, SensorEntity):
     _attr_name = "Power"
 
 
-class EnetCurrentSensor(EnetBaseChannelEntity, SensorEntity):
+class EnetCurrentSensor(EnetMeasurementSensor):
     """Representation of a Enet Current sensor."""
 
     _attr_native_unit_of_measurement = UnitOfElectricCurrent.MILLIAMPERE
@@ -113,7 +173,7 @@ class EnetCurrentSensor(EnetBaseChannelEntity, SensorEntity):
     _attr_name = "Current"
 
 
-class EnetVoltageSensor(EnetBaseChannelEntity, SensorEntity):
+class EnetVoltageSensor(EnetMeasurementSensor):
     """Representation of a Enet Voltage sensor."""
 
     _attr_native_unit_of_measurement = UnitOfElectricPotential.MILLIVOLT
@@ -124,7 +184,7 @@ class EnetVoltageSensor(EnetBaseChannelEntity, SensorEntity):
     _attr_name = "Voltage"
 
 
-class EnetEnergySensor(EnetBaseChannelEntity, SensorEntity):
+class EnetEnergySensor(EnetMeasurementSensor):
     """Representation of a Enet Energy sensor."""
 
     _attr_native_unit_of_measurement = UnitOfEnergy.WATT_HOUR
@@ -135,7 +195,7 @@ class EnetEnergySensor(EnetBaseChannelEntity, SensorEntity):
     _attr_name = "Total energy consumed"
 
 
-class EnetLightLevelSensor(EnetBaseChannelEntity, SensorEntity):
+class EnetLightLevelSensor(EnetMeasurementSensor):
     """Representation of a Enet LightLevel sensor."""
 
     _attr_native_unit_of_measurement = LIGHT_LUX
@@ -174,6 +234,7 @@ class EnetBatterySensor(EnetBaseDeviceEntity, SensorEntity):
 
     async def async_added_to_hass(self):
         """Subscribe entity to updates when added to hass."""
+        await super().async_added_to_hass()
         self.async_on_remove(
             self.coordinator.async_add_listener(self.async_write_ha_state)
         )
@@ -0,0 +1,153 @@
+"Services for the Enet Smart Home integration"
+
+import asyncio
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+
+from .aioenet import SET_MANY_CONCURRENCY
+from .const import (
+    DOMAIN,
+    SERVICE_REFRESH_DEVICES,
+    SERVICE_RESYNC_VALUES,
+    SERVICE_SET_CHANNELS,
+    ATTR_FULL,
+    ATTR_ITEMS,
+    ATTR_CHANNEL,
+    ATTR_FUNCTION,
+    ATTR_VALUE,
+    ATTR_MAX_CONCURRENCY,
+)
+from .enet_data.enums import ChannelTypeFunctionName
+from .entity import get_command_priority
+
+_LOGGER = logging.getLogger(__name__)
+
+REFRESH_DEVICES_SCHEMA = vol.Schema({vol.Optional(ATTR_FULL, default=False): cv.boolean})
+
+SET_CHANNELS_ITEM_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive(ATTR_ENTITY_ID, "target"): cv.entity_id,
+            vol.Exclusive(ATTR_CHANNEL, "target"): cv.string,
+            vol.Required(ATTR_FUNCTION): vol.In(
+                [function.value for function in ChannelTypeFunctionName]
+            ),
+            # Strings are only valid for functions that take strings, set_value
+            # rejects them for on/off functions
+            vol.Optional(ATTR_VALUE): vol.Any(bool, vol.Coerce(float), cv.string),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_ENTITY_ID, ATTR_CHANNEL),
+)
+SET_CHANNELS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ITEMS): vol.All(cv.ensure_list, [SET_CHANNELS_ITEM_SCHEMA]),
+        vol.Optional(ATTR_MAX_CONCURRENCY, default=SET_MANY_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=32)
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Enet services, once for all config entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_REFRESH_DEVICES):
+        return
+
+    async def async_refresh_devices(call: ServiceCall) -> None:
+        """Pick up devices that were added, removed or changed on the server."""
+        for hub in list(hass.data.get(DOMAIN, {}).values()):
+            _LOGGER.debug("Refreshing devices of %s", hub.baseurl)
+            await hub.coordinator.async_refresh_topology(force=call.data[ATTR_FULL])
+
+    async def async_resync_values(call: ServiceCall) -> None:
+        """Fetch the current value of all channels from the server."""
+        for hub in list(hass.data.get(DOMAIN, {}).values()):
+            await hub.coordinator.async_resync_values()
+
+    @callback
+    def resolve_channel(item) -> tuple[str | None, str | None]:
+        """Return the config entry id and channel uid of a set_channels item."""
+        hubs = hass.data.get(DOMAIN, {})
+        if ATTR_ENTITY_ID in item:
+            entity_entry = er.async_get(hass).async_get(item[ATTR_ENTITY_ID])
+            if entity_entry is None or entity_entry.platform != DOMAIN:
+                return None, None
+            return entity_entry.config_entry_id, entity_entry.unique_id
+        channel_uid = item[ATTR_CHANNEL]
+        device_uid = channel_uid.rpartition("-")[0]
+        for entry_id, hub in hubs.items():
+            if any(device.uid == device_uid for device in hub.devices):
+                return entry_id, channel_uid
+        return None, channel_uid
+
+    async def async_set_channels(call: ServiceCall) -> ServiceResponse:
+        """Send commands to many channels concurrently."""
+        hubs = hass.data.get(DOMAIN, {})
+        items = call.data[ATTR_ITEMS]
+        results: list[dict | None] = [None] * len(items)
+        items_by_hub: dict[str, list[tuple[int, tuple]]] = {}
+        for index, item in enumerate(items):
+            entry_id, channel_uid = resolve_channel(item)
+            command = (channel_uid, item[ATTR_FUNCTION], item.get(ATTR_VALUE))
+            if entry_id not in hubs:
+                results[index] = {
+                    ATTR_ENTITY_ID: item.get(ATTR_ENTITY_ID),
+                    "channel": channel_uid,
+                    "function": item[ATTR_FUNCTION],
+                    "value": item.get(ATTR_VALUE),
+                    "success": False,
+                    "error": "Unknown entity or channel",
+                }
+                continue
+            items_by_hub.setdefault(entry_id, []).append((index, command))
+
+        priority = get_command_priority(call.context)
+
+        async def send(entry_id, indexed_commands):
+            hub_results = await hubs[entry_id].set_many(
+                [command for _index, command in indexed_commands],
+                call.data[ATTR_MAX_CONCURRENCY],
+                priority,
+            )
+            for (index, _command), result in zip(indexed_commands, hub_results):
+                result[ATTR_ENTITY_ID] = items[index].get(ATTR_ENTITY_ID)
+                results[index] = result
+
+        await asyncio.gather(
+            *(send(entry_id, commands) for entry_id, commands in items_by_hub.items())
+        )
+        failed = sum(1 for result in results if not result["success"])
+        if failed:
+            _LOGGER.warning("%d of %d Enet commands failed", failed, len(results))
+        if call.return_response:
+            return {"results": results}
+        return None
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH_DEVICES,
+        async_refresh_devices,
+        schema=REFRESH_DEVICES_SCHEMA,
+    )
+    hass.services.async_register(DOMAIN, SERVICE_RESYNC_VALUES, async_resync_values)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_CHANNELS,
+        async_set_channels,
+        schema=SET_CHANNELS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,38 @@
+"Persist the last known channel values for a warm start"
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .aioenet import EnetClient
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Values are written at most once per delay, no matter how many events arrive
+SAVE_DELAY = 60
+
+
+def get_values_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store holding the last known values of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.values")
+
+
+async def async_restore_values(store: Store, hub: EnetClient) -> None:
+    """Restore the last known values into the devices of the client."""
+    values = await store.async_load()
+    if values:
+        hub.import_values(values)
+        _LOGGER.debug("Restored %d channel values", len(values.get("channels", {})))
+
+
+@callback
+def async_schedule_save_values(store: Store, hub: EnetClient) -> None:
+    """Schedule a coalesced write of the current values."""
+    store.async_delay_save(hub.export_values, SAVE_DELAY)
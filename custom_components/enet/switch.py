@@ -2,12 +2,15 @@
 import logging
 
 from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from custom_components.enet.enet_data.enums import ChannelApplicationMode, ChannelTypeFunctionName
+from custom_components.enet.enet_data.enums import ChannelTypeFunctionName
 
 from .entity import EnetBaseChannelEntity
-from .aioenet import ActuatorChannel
-from .const import DOMAIN
+from .enums import ChannelPlatform
+from .utils import add_entities_at_once
+from .const import DOMAIN, SIGNAL_DEVICES_ADDED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,14 +19,24 @@ async def async_setup_entry(hass, entry, async_add_entities):
     """Add Enet switch devices from a config entry"""
     hub = hass.data[DOMAIN][entry.entry_id]
 
-    supported_app_modes = [
-        ChannelApplicationMode.SWITCHING
-    ]
+    @callback
+    def async_add_devices(devices):
+        add_entities_at_once(
+            async_add_entities,
+            [
+                EnetSwitch(channel, hub.coordinator)
+                for _kind, channel in hub.get_platform_routes(
+                    ChannelPlatform.SWITCH, devices
+                )
+            ],
+        )
 
-    for device in hub.devices:
-        for channel in device.channels:
-            if isinstance(channel, ActuatorChannel) and channel.application_mode in supported_app_modes:
-                async_add_entities([EnetSwitch(channel, hub.coordinator)])
+    async_add_devices(hub.devices)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), async_add_devices
+        )
+    )
     _LOGGER.info("Finished async setup()")
 
 
@@ -41,6 +54,7 @@ class EnetSwitch(EnetBaseChannelEntity, SwitchEntity):
 
     async def async_added_to_hass(self):
         """Subscribe entity to updates when added to hass."""
+        await super().async_added_to_hass()
         self.async_on_remove(
             self.coordinator.async_add_listener(self.async_write_ha_state)
         )
@@ -49,11 +63,9 @@ class EnetSwitch(EnetBaseChannelEntity, SwitchEntity):
         """Turn the switch on."""
         _LOGGER.info("async_turn_on: (%s) %s", self.name, kwargs)
 
-        await self.channel.turn_on()
-        self.async_write_ha_state()
+        await self.channel.turn_on(self.command_priority)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the switch off."""
         _LOGGER.info("async_turn_off: (%s) %s", self.name, kwargs)
-        await self.channel.turn_off()
-        self.async_write_ha_state()
+        await self.channel.turn_off(self.command_priority)
@@ -0,0 +1,96 @@
+"Shared deadline timers for the Enet Smart Home integration"
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from typing import Callable, Hashable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TimerWheel:
+    """Run callbacks at per-key deadlines using a single loop.call_at handle.
+
+    Scheduling a key again moves its deadline, no task or handle is created per
+    timer. Outdated heap entries are skipped when they come up."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._deadlines: dict[Hashable, tuple[float, Callable[[], None]]] = {}
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._counter = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_when: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def schedule(self, key: Hashable, delay: float, callback: Callable[[], None]) -> None:
+        """Call callback after delay seconds, replacing the timer of key"""
+        when = self._loop.time() + delay
+        self._deadlines[key] = (when, callback)
+        self._counter += 1
+        heapq.heappush(self._heap, (when, self._counter, key))
+        if len(self._heap) > 2 * len(self._deadlines) + 16:
+            self._compact()
+        if self._handle_when is None or when < self._handle_when:
+            self._arm(when)
+
+    def cancel(self, key: Hashable) -> None:
+        """Cancel the timer of key, if any"""
+        if self._deadlines.pop(key, None) is not None and not self._deadlines:
+            self._disarm()
+
+    def cancel_all(self) -> None:
+        """Cancel all timers"""
+        self._deadlines.clear()
+        self._disarm()
+
+    def _compact(self) -> None:
+        self._heap = [
+            entry
+            for entry in self._heap
+            if self._deadlines.get(entry[2], (None,))[0] == entry[0]
+        ]
+        heapq.heapify(self._heap)
+
+    def _arm(self, when: float) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = self._loop.call_at(when, self._run)
+        self._handle_when = when
+
+    def _disarm(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = None
+        self._handle_when = None
+        self._heap.clear()
+
+    def _run(self) -> None:
+        self._handle = None
+        self._handle_when = None
+        now = self._loop.time()
+        while self._heap and self._heap[0][0] <= now:
+            when, _counter, key = heapq.heappop(self._heap)
+            deadline = self._deadlines.get(key)
+            if deadline is None or deadline[0] != when:
+                continue
+            del self._deadlines[key]
+            try:
+                deadline[1]()
+            except Exception:
+                _LOGGER.exception("Error in timer callback for %s", key)
+        # Drop outdated entries so the next wake up is for a live deadline
+        while self._heap:
+            when, _counter, key = self._heap[0]
+            deadline = self._deadlines.get(key)
+            if deadline is not None and deadline[0] == when:
+                self._arm(when)
+                break
+            heapq.heappop(self._heap)
@@ -0,0 +1,73 @@
+"Persist the Enet device topology so setup does not depend on the server"
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .aioenet import EnetClient
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+def get_topology_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store holding the cached topology of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.topology")
+
+
+async def async_load_cached_topology(store: Store, hub: EnetClient) -> bool:
+    """Load the cached topology into the client. Return True if a cache was found."""
+    topology = await store.async_load()
+    if not topology:
+        return False
+    hub.import_topology(topology)
+    _LOGGER.debug("Loaded cached topology for project %s", hub.project_version)
+    return True
+
+
+async def async_download_topology(
+    store: Store, hub: EnetClient, project_version: dict | None = None
+) -> list:
+    """Download the devices from the server and persist them."""
+    hub.clear_topology()
+    if project_version is None:
+        project_version = await hub.get_project_version()
+    devices = await hub.get_devices()
+    hub.project_version = project_version
+    await store.async_save(hub.export_topology())
+    return devices
+
+
+async def async_refresh_topology(
+    store: Store, hub: EnetClient, force: bool = False
+) -> tuple[list, list, list] | None:
+    """Fetch changed devices if the project was modified on the server.
+
+    Returns the (added, removed, updated) devices, or None if the project is
+    unchanged. If the project changed but no new or moved devices were found,
+    all devices are fetched and compared since devices may have been edited.
+    """
+    project_version = await hub.get_project_version()
+    # An unknown version never matches, the devices are compared instead
+    if not force and project_version is not None and project_version == hub.project_version:
+        _LOGGER.debug("Enet project is unchanged")
+        return None
+
+    _LOGGER.info(
+        "Enet project changed (%s -> %s), refreshing devices",
+        hub.project_version,
+        project_version,
+    )
+    added, removed, updated = await hub.refresh_devices(full=force)
+    if not force and not (added or removed or updated):
+        added, removed, updated = await hub.refresh_devices(full=True)
+
+    hub.project_version = project_version
+    await store.async_save(hub.export_topology())
+    return added, removed, updated
@@ -27,4 +27,10 @@ def get_device_info(enet_device):
             ATTR_SUGGESTED_AREA: enet_device.location.partition(":")[2],
             ATTR_VIA_DEVICE: (DOMAIN, NAME_ENET_CONTROLLER),
         }
-    )
\ No newline at end of file
+    )
+
+
+def add_entities_at_once(async_add_entities, entities):
+    """Register entities with a single async_add_entities call, if there are any."""
+    if entities:
+        async_add_entities(entities)
@@ -0,0 +1,326 @@
+"""Benchmarks for the Enet Smart Home integration.
+
+Runs against a Home Assistant debug file (see load_debug_file.py) or against a
+synthetic project generated from the device catalog. Home Assistant itself is
+only needed for the logbook benchmark, the setup benchmark uses a stand-in for
+entity registration.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import re
+import time
+import tracemalloc
+import uuid
+from os.path import abspath, dirname
+from sys import path
+
+path.insert(1, dirname(dirname(abspath(__file__)))+"/custom_components/")
+
+from enet import aioenet
+from enet.enet_data.channel_mapping import CHANNEL_TYPE_CONFIGURATION
+from enet.enet_data.data import enet_data
+from enet.enet_data.utils import intern_strings
+
+# Channel type and application mode used for the synthetic project
+SYNTHETIC_CHANNEL_TYPES = {
+    "CT_1F02": "LIGHT_DIMMING",
+    "CT_1F01": "LIGHT_SWITCHING",
+    "CT_1F03": "BLINDS",
+    "CT_1F11": "ROCKER",
+    "CT_1F19": "ENERGY",
+}
+
+
+def default_values(value_type_container_id):
+    "Return currentValues for a value type container with default values"
+    return enet_data.get_value_template_from_value_container(value_type_container_id)
+
+
+def make_synthetic_channel(no, channel_type, application_mode):
+    "Create a raw device channel with all functions and parameters of the channel type"
+    channel_type_data = enet_data.get_channel_type_by_id(channel_type)
+    app_mode_param = CHANNEL_TYPE_CONFIGURATION[channel_type]["deviceParameters"].get("applicationMode")
+
+    def function(type_id, function_type):
+        return {
+            "uid": str(uuid.uuid4()),
+            "typeID": type_id,
+            "active": True,
+            "currentValues": default_values(function_type.get("valueTypeContainerTypeID")),
+        }
+
+    parameters = []
+    for type_id in channel_type_data.get("deviceParameterTypeIDs", []):
+        parameter = function(type_id, enet_data.get_device_parameter_type_by_id(type_id))
+        if type_id == app_mode_param:
+            parameter["currentValues"] = [{"value": application_mode, "valueTypeID": "VT_APPLICATION_MODE"}]
+        parameters.append(parameter)
+    if app_mode_param and app_mode_param not in channel_type_data.get("deviceParameterTypeIDs", []):
+        parameters.append({
+            "uid": str(uuid.uuid4()),
+            "typeID": app_mode_param,
+            "active": True,
+            "currentValues": [{"value": application_mode, "valueTypeID": "VT_APPLICATION_MODE"}],
+        })
+
+    return {
+        "no": no,
+        "channelTypeID": channel_type,
+        "effectArea": f"Room {no}",
+        "inputDeviceFunctions": [
+            function(type_id, enet_data.get_input_device_function_type_by_id(type_id))
+            for type_id in channel_type_data.get("inputDeviceFunctionTypeIDs", [])
+        ],
+        "outputDeviceFunctions": [
+            function(type_id, enet_data.get_output_device_function_type_by_id(type_id))
+            for type_id in channel_type_data.get("outputDeviceFunctionTypeIDs", [])
+        ],
+        "deviceParameters": parameters,
+    }
+
+
+def make_synthetic_project(channel_count, channels_per_device=4):
+    "Create a raw device list with channel_count channels"
+    channel_types = list(SYNTHETIC_CHANNEL_TYPES.items())
+    devices = []
+    for device_no in range(0, channel_count, channels_per_device):
+        channel_type, application_mode = channel_types[(device_no // channels_per_device) % len(channel_types)]
+        channels = [
+            make_synthetic_channel(no + 1, channel_type, application_mode)
+            for no in range(min(channels_per_device, channel_count - device_no))
+        ]
+        devices.append({
+            "uid": str(uuid.uuid4()),
+            "typeID": "DVT_DA1R",
+            "installationArea": f"Device {device_no // channels_per_device}",
+            "batteryState": None,
+            "isSoftwareUpdateAvailable": False,
+            "metaData": {"serialNumber": f"SN{device_no:06d}"},
+            "deviceChannelConfigurationGroups": [{"no": 1, "deviceChannels": channels}],
+        })
+    # Round trip through json so strings are not shared like in a real response
+    return json.loads(json.dumps(devices))
+
+
+def load_project(args):
+    "Return the raw device list from a debug file or a synthetic project"
+    if args.filename:
+        with open(args.filename) as fp:
+            return json.load(fp)["data"]["enet_data"]
+    return make_synthetic_project(args.channels)
+
+
+def build_devices(raw_devices):
+    "Build the device model from a raw device list"
+    client = aioenet.EnetClient("http://localhost", "", "", True)
+    client._raw_json = raw_devices
+    return asyncio.run(client.get_devices())
+
+
+def measure(func, *args):
+    "Return result, duration and allocated memory of func"
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    duration = time.perf_counter() - start
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, duration, size
+
+
+def benchmark_memory(args):
+    "Compare resident size of the project with and without string interning"
+    text = json.dumps(load_project(args))
+    print(f"Project payload: {len(text) / 1024:.0f} KiB")
+
+    raw, duration, plain_size = measure(json.loads, text)
+    print(f"Parsed payload:             {plain_size / 1024:8.0f} KiB {duration * 1000:8.1f} ms")
+    raw, duration, interned_size = measure(lambda: intern_strings(json.loads(text)))
+    print(f"Parsed and interned:        {interned_size / 1024:8.0f} KiB {duration * 1000:8.1f} ms")
+
+    raw = json.loads(text)
+    devices, duration, model_size = measure(build_devices, raw)
+    print(f"Model ({len(devices)} devices):  {model_size / 1024:8.0f} KiB {duration * 1000:8.1f} ms")
+    raw = intern_strings(json.loads(text))
+    devices, duration, model_size = measure(build_devices, raw)
+    print(f"Model, interned payload:    {model_size / 1024:8.0f} KiB {duration * 1000:8.1f} ms")
+
+
+def apply_parameter_filter(raw_devices, parameter_filter):
+    "Emulate the server: leave out the device parameters matching parameter_filter"
+    pattern = re.compile(parameter_filter)
+    for raw in raw_devices:
+        for group in raw["deviceChannelConfigurationGroups"]:
+            for channel in group["deviceChannels"]:
+                channel["deviceParameters"] = [
+                    parameter for parameter in channel["deviceParameters"]
+                    if not pattern.fullmatch(parameter["typeID"])
+                ]
+    return raw_devices
+
+
+def benchmark_filter(args):
+    "Compare payload size and parse time of the device parameter filters"
+    text = json.dumps(load_project(args))
+    filters = {
+        "none (as loaded)": None,
+        "legacy": aioenet.LEGACY_PARAMETER_FILTER,
+        "minimal": aioenet.minimal_parameter_filter(),
+    }
+    for name, parameter_filter in filters.items():
+        raw = json.loads(text)
+        if parameter_filter:
+            raw = apply_parameter_filter(raw, parameter_filter)
+        payload = json.dumps(raw)
+        start = time.perf_counter()
+        devices = build_devices(intern_strings(json.loads(payload)))
+        duration = time.perf_counter() - start
+        print(f"{name:18} {len(payload) / 1024:8.0f} KiB {duration * 1000:8.1f} ms "
+              f"{sum(len(d.channels) for d in devices)} channels")
+
+
+class EntityPlatformStandIn:
+    "Schedules a task per async_add_entities call like EntityPlatform does"
+
+    def __init__(self, name):
+        self.name = name
+        self.tasks = []
+        self.calls = 0
+
+    def async_add_entities(self, entities):
+        self.calls += 1
+        self.tasks.append(asyncio.ensure_future(self._add_entities(entities)))
+
+    async def _add_entities(self, entities):
+        await asyncio.gather(*(self._add_entity(entity) for entity in entities))
+
+    async def _add_entity(self, entity):
+        await asyncio.sleep(0)
+
+
+def setup_per_entity(devices, platform):
+    "Platform setup before routing: scan all channels and add entities one by one"
+    for device in devices:
+        if platform.name == aioenet.ChannelPlatform.SENSOR and device.battery_state is not None:
+            platform.async_add_entities([device])
+        for channel in device.channels:
+            if channel.application_mode not in aioenet.PLATFORM_APPLICATION_MODES[platform.name]:
+                continue
+            if platform.name in (aioenet.ChannelPlatform.SENSOR, aioenet.ChannelPlatform.BINARY_SENSOR):
+                if not isinstance(channel, aioenet.SensorChannel):
+                    continue
+                for output_function in channel.output_functions.values():
+                    if output_function["function"] in aioenet.PLATFORM_OUTPUT_FUNCTIONS[platform.name]:
+                        platform.async_add_entities([channel])
+            elif isinstance(channel, aioenet.ActuatorChannel):
+                platform.async_add_entities([channel])
+
+
+def setup_batched(devices, platform, chunk_size=None):
+    "Platform setup from the routes with one async_add_entities call per chunk"
+    entities = [target for _kind, target in devices[0].client.get_platform_routes(platform.name, devices)]
+    chunk_size = chunk_size or max(len(entities), 1)
+    for start in range(0, len(entities), chunk_size):
+        platform.async_add_entities(entities[start : start + chunk_size])
+
+
+async def run_setup(devices, setup, *args):
+    "Set up all platforms and wait until all entities are added"
+    platforms = []
+    start = time.perf_counter()
+    for name in aioenet.ChannelPlatform:
+        platform = EntityPlatformStandIn(name)
+        setup(devices, platform, *args)
+        platforms.append(platform)
+    await asyncio.gather(*(task for platform in platforms for task in platform.tasks))
+    duration = time.perf_counter() - start
+    return duration, sum(platform.calls for platform in platforms)
+
+
+def benchmark_setup(args):
+    "Compare platform setup with one call per entity and batched calls"
+    devices = build_devices(intern_strings(load_project(args)))
+    devices[0].client.devices = devices
+    variants = {
+        "per entity": (setup_per_entity,),
+        "batched": (setup_batched,),
+    }
+    if args.chunk_size:
+        variants[f"chunks of {args.chunk_size}"] = (setup_batched, args.chunk_size)
+    for name, (setup, *setup_args) in variants.items():
+        durations = []
+        for _ in range(args.repeat):
+            duration, calls = asyncio.run(run_setup(devices, setup, *setup_args))
+            durations.append(duration)
+        print(f"{name:18} {calls:6} calls {min(durations) * 1000:8.1f} ms")
+
+
+def benchmark_logbook(args):
+    "Render enet_event logbook entries with cold and warm description caches"
+    from types import SimpleNamespace
+
+    from homeassistant.core import Event
+    from homeassistant.helpers import device_registry as dr
+
+    from enet.const import ATTR_ENET_EVENT
+    from enet.logbook import async_describe_events
+
+    device_ids = [f"device{no}" for no in range(args.devices)]
+    registry = SimpleNamespace(
+        devices={device_id: SimpleNamespace(name=f"Switch {device_id}") for device_id in device_ids}
+    )
+    registry.async_get = registry.devices.get
+    hass = SimpleNamespace(
+        data={dr.DATA_REGISTRY: registry},
+        bus=SimpleNamespace(async_listen=lambda event_type, listener: None),
+    )
+    describers = {}
+    async_describe_events(hass, lambda domain, event_type, describe: describers.update({event_type: describe}))
+    describe = describers[ATTR_ENET_EVENT]
+
+    event_types = ["initial_press", "short_release", "long_release"]
+    events = [
+        Event(ATTR_ENET_EVENT, {
+            "device_id": device_ids[no % len(device_ids)],
+            "unique_id": str(no),
+            "type": event_types[no % len(event_types)],
+            "subtype": str(no % 8 + 1),
+        })
+        for no in range(args.events)
+    ]
+    for name in ("cold cache", "warm cache"):
+        start = time.perf_counter()
+        for event in events:
+            describe(event)
+        print(f"{name:18} {len(events)} events {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+parser = argparse.ArgumentParser(description="Enet Smart Home integration benchmarks")
+parser.add_argument("--filename", help="/path/to/debug file to load, uses a synthetic project if omitted")
+parser.add_argument("--channels", help="number of channels in the synthetic project", type=int, default=500)
+parser.add_argument("--debug", help="enable debug logging", action="store_true")
+subparsers = parser.add_subparsers(dest="benchmark", required=True)
+subparsers.add_parser("memory", help="memory use of the parsed project").set_defaults(func=benchmark_memory)
+subparsers.add_parser("filter", help="payload size and parse time per parameter filter").set_defaults(func=benchmark_filter)
+setup_parser = subparsers.add_parser("setup", help="platform setup with and without batching")
+setup_parser.add_argument("--chunk-size", help="also measure batches of this size", type=int)
+setup_parser.add_argument("--repeat", help="number of runs, the fastest is reported", type=int, default=5)
+setup_parser.set_defaults(func=benchmark_setup)
+logbook_parser = subparsers.add_parser("logbook", help="logbook rendering of enet events, needs Home Assistant")
+logbook_parser.add_argument("--events", help="number of events to render", type=int, default=10000)
+logbook_parser.add_argument("--devices", help="number of devices sending the events", type=int, default=50)
+logbook_parser.set_defaults(func=benchmark_logbook)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    if args.debug:
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format="%(asctime)-15s %(levelname)-5s %(name)s -- %(message)s",
+        )
+    args.func(args)
@@ -0,0 +1,59 @@
+"""Tests for last-write-wins coalescing of slider commands."""
+import asyncio
+
+from custom_components.enet.aioenet import CommandCoalescer
+
+
+async def submit_while_in_flight():
+    coalescer = CommandCoalescer(window=0.05)
+    sent = []
+
+    def command(value):
+        async def send():
+            sent.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        return send
+
+    first = asyncio.ensure_future(coalescer.submit("brightness", command(10)))
+    await asyncio.sleep(0.005)
+    # Both arrive while the first command is in flight, only the newest is sent
+    results = await asyncio.gather(
+        first,
+        coalescer.submit("brightness", command(20)),
+        coalescer.submit("brightness", command(30)),
+    )
+    return results, sent, coalescer
+
+
+def test_replaced_callers_receive_the_newest_result():
+    results, sent, coalescer = asyncio.run(submit_while_in_flight())
+
+    assert sent == [10, 30]
+    assert results == [10, 30, 30]
+    assert coalescer.sent == 2
+    assert coalescer.replaced == 1
+
+
+async def discard_pending():
+    coalescer = CommandCoalescer(window=0.05)
+    sent = []
+
+    async def send(value):
+        sent.append(value)
+        return value
+
+    first = asyncio.ensure_future(coalescer.submit("position", lambda: send(1)))
+    await asyncio.sleep(0.005)
+    pending = asyncio.ensure_future(coalescer.submit("position", lambda: send(2)))
+    await asyncio.sleep(0)
+    coalescer.discard(["position"])
+    return await asyncio.gather(first, pending), sent
+
+
+def test_discarded_command_is_not_sent():
+    results, sent = asyncio.run(discard_pending())
+
+    assert sent == [1]
+    assert results == [1, None]
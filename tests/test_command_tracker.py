@@ -0,0 +1,149 @@
+"""Tests for the confirmation of commands by output function events."""
+import asyncio
+import uuid
+
+from custom_components.enet import aioenet
+from custom_components.enet.enet_data.data import enet_data
+from custom_components.enet.enet_data.enums import ChannelTypeFunctionName
+from custom_components.enet.switch import EnetSwitch
+
+
+def make_switch_device():
+    "Return a raw device with a single switching channel"
+
+    def function(type_id, function_type):
+        return {
+            "uid": str(uuid.uuid4()),
+            "typeID": type_id,
+            "active": True,
+            "currentValues": enet_data.get_value_template_from_value_container(
+                function_type.get("valueTypeContainerTypeID")
+            ),
+        }
+
+    channel = {
+        "no": 1,
+        "channelTypeID": "CT_1F01",
+        "effectArea": "Kitchen",
+        "inputDeviceFunctions": [
+            function("FT_INSA.SOO", enet_data.get_input_device_function_type_by_id("FT_INSA.SOO"))
+        ],
+        "outputDeviceFunctions": [
+            function("FT_INSA.IOO", enet_data.get_output_device_function_type_by_id("FT_INSA.IOO"))
+        ],
+        "deviceParameters": [
+            {
+                "uid": str(uuid.uuid4()),
+                "typeID": "PT_INSA.APPLICATION_MODE_DUMMY",
+                "active": True,
+                "currentValues": [
+                    {"value": "LIGHT_SWITCHING", "valueTypeID": "VT_APPLICATION_MODE"}
+                ],
+            }
+        ],
+    }
+    return {
+        "uid": str(uuid.uuid4()),
+        "typeID": "DVT_DA1R",
+        "installationArea": "Kitchen switch",
+        "batteryState": None,
+        "isSoftwareUpdateAvailable": False,
+        "metaData": {"serialNumber": "SN000001"},
+        "deviceChannelConfigurationGroups": [{"no": 1, "deviceChannels": [channel]}],
+    }
+
+
+async def make_client(**kwargs):
+    "Return an online client with a single switch channel that answers every request"
+    client = aioenet.EnetClient("http://localhost", "", "", noconnect=True, **kwargs)
+    client._raw_json = [make_switch_device()]
+    client.devices = await client.get_devices()
+    client._offline = False
+
+    async def do_request(url, method, params, *args):
+        return {}
+
+    client._do_request = do_request
+    return client, client.devices[0].channels[0]
+
+
+def confirm_on(client, channel, value=True):
+    "Deliver the event confirming that channel switched on, like the coordinator"
+    output_uid = channel.output_functions["FT_INSA.IOO"]["uid"]
+    return client.tracker.confirm(
+        output_uid, [{"value": value, "valueTypeID": "VT_SWITCH_STATE"}]
+    )
+
+
+async def set_many_and_confirm():
+    client, channel = await make_client()
+    states = []
+
+    async def write_state():
+        # Stand-in for EnetBaseChannelEntity.on_value_updated
+        states.append(channel.get_current_value(ChannelTypeFunctionName.ON_OFF))
+
+    channel.on_update_callbacks.append(write_state)
+    results = await client.set_many([(channel.uid, ChannelTypeFunctionName.ON_OFF, True)])
+    confirmed = confirm_on(client, channel)
+    return results, confirmed, states, client.tracker.metrics()
+
+
+def test_set_many_writes_state_confirmed_by_event():
+    results, confirmed, states, metrics = asyncio.run(set_many_and_confirm())
+
+    assert results[0]["success"]
+    # The event only confirms the value, the state was written when sending
+    assert confirmed
+    assert states == [True]
+    assert metrics["confirmed"] == 1
+    assert metrics["pending"] == 0
+
+
+async def turn_on_switch_and_confirm():
+    client, channel = await make_client()
+    switch = EnetSwitch(channel, coordinator=None)
+    writes = []
+    switch.async_write_ha_state = lambda: writes.append(switch.is_on)
+
+    await switch.async_turn_on()
+    if not confirm_on(client, channel):
+        await channel.update_values(
+            channel.output_functions["FT_INSA.IOO"]["uid"],
+            [{"value": True, "valueTypeID": "VT_SWITCH_STATE"}],
+        )
+    return writes
+
+
+def test_entity_command_writes_state_once():
+    assert asyncio.run(turn_on_switch_and_confirm()) == [True]
+
+
+async def queue_command_behind_rate_limit():
+    # One request per 0.2s, confirmations time out after 0.05s
+    client, channel = await make_client(
+        request_rate=5, request_burst=1, confirm_timeout=0.05
+    )
+    await channel.turn_on()
+    assert confirm_on(client, channel)
+
+    turn_off = asyncio.ensure_future(channel.turn_off())
+    await asyncio.sleep(0.1)
+    queued = not turn_off.done()
+    value_while_queued = channel.get_current_value(ChannelTypeFunctionName.ON_OFF)
+    await turn_off
+    confirmed = confirm_on(client, channel, False)
+    return queued, value_while_queued, confirmed, client.tracker.metrics()
+
+
+def test_confirmation_timeout_starts_when_command_is_sent():
+    queued, value_while_queued, confirmed, metrics = asyncio.run(
+        queue_command_behind_rate_limit()
+    )
+
+    assert queued
+    # Waiting in the scheduler queue is not a missing confirmation
+    assert value_while_queued is False
+    assert confirmed
+    assert metrics["expired"] == 0
+    assert metrics["rtt_max"] < 0.05
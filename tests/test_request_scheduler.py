@@ -0,0 +1,63 @@
+"""Tests for the priority scheduling and rate limit of requests."""
+import asyncio
+
+from custom_components.enet.aioenet import CommandPriority, RequestScheduler
+
+
+async def admit_in_order(priorities):
+    "Empty the bucket, queue acquires of priorities and return the admission order"
+    scheduler = RequestScheduler(rate=100, burst=1)
+    await scheduler.acquire(CommandPriority.AUTOMATION)
+    admitted = []
+
+    async def acquire(priority):
+        await scheduler.acquire(priority)
+        admitted.append(priority)
+
+    await asyncio.gather(*(acquire(priority) for priority in priorities))
+    return admitted
+
+
+def test_queued_requests_are_admitted_by_priority():
+    admitted = asyncio.run(
+        admit_in_order(
+            [
+                CommandPriority.BACKGROUND,
+                CommandPriority.AUTOMATION,
+                CommandPriority.INTERACTIVE,
+                CommandPriority.BACKGROUND,
+            ]
+        )
+    )
+
+    assert admitted == [
+        CommandPriority.INTERACTIVE,
+        CommandPriority.AUTOMATION,
+        CommandPriority.BACKGROUND,
+        CommandPriority.BACKGROUND,
+    ]
+
+
+async def cancel_queued_request():
+    # A token every 0.1s
+    scheduler = RequestScheduler(rate=10, burst=1)
+    await scheduler.acquire(CommandPriority.BACKGROUND)
+    cancelled = asyncio.ensure_future(scheduler.acquire(CommandPriority.INTERACTIVE))
+    waiting = asyncio.ensure_future(scheduler.acquire(CommandPriority.BACKGROUND))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await waiting
+    return loop.time() - start, scheduler.metrics()
+
+
+def test_cancelled_request_does_not_use_a_token():
+    waited, metrics = asyncio.run(cancel_queued_request())
+
+    # The next token goes to the remaining request, not a second one later
+    assert waited < 0.15
+    assert metrics["priorities"]["interactive"]["requests"] == 0
+    assert metrics["priorities"]["background"]["requests"] == 2
+    assert metrics["queue_depth"] == 0
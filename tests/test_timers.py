@@ -0,0 +1,42 @@
+"""Tests for the shared deadline timers."""
+import asyncio
+
+from custom_components.enet.timers import TimerWheel
+
+
+async def reschedule():
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    start = loop.time()
+    fired = []
+    wheel.schedule("motion", 0.02, lambda: fired.append(loop.time() - start))
+    wheel.schedule("motion", 0.06, lambda: fired.append(loop.time() - start))
+
+    await asyncio.sleep(0.04)
+    fired_early = list(fired)
+    await asyncio.sleep(0.06)
+    return fired_early, fired, len(wheel)
+
+
+def test_rescheduled_deadline_fires_once_at_the_later_time():
+    fired_early, fired, pending = asyncio.run(reschedule())
+
+    assert fired_early == []
+    assert len(fired) == 1
+    assert fired[0] >= 0.06
+    assert pending == 0
+
+
+async def cancel_one_of_two():
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    fired = []
+    wheel.schedule("a", 0.01, lambda: fired.append("a"))
+    wheel.schedule("b", 0.02, lambda: fired.append("b"))
+    wheel.cancel("a")
+    await asyncio.sleep(0.04)
+    return fired
+
+
+def test_cancelled_timer_does_not_fire():
+    assert asyncio.run(cancel_one_of_two()) == ["b"]